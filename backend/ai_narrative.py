@@ -2,19 +2,37 @@
 AI narrative generation for LifeSim using Gemini.
 
 This module handles:
-- Generating event narratives
+- Generating event narratives (buffered or streamed)
 - Creating consequence narratives
 - Providing learning moments
 - Adapting tone based on player profile
+- Gemini context caching for the static instruction blocks
+- Generating an event narrative and its options in one JSON-mode call
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, AsyncIterator
 from google import genai
+from google.genai import errors, types
+import asyncio
+import httpx
 import os
+import random
+import time
 import json
+import copy
+import hashlib
+import logging
+import math
 from pathlib import Path
+from pydantic import BaseModel
+from sqlalchemy.exc import InvalidRequestError
 
 from models import PlayerProfile, GameState, RiskAttitude, EducationPath
+from cache_utils import TTLCache
+from game_engine import StateBefore
+from utils import get_decision_context_for_llm
+
+logger = logging.getLogger(__name__)
 
 
 # Load prompt templates
@@ -57,13 +75,10 @@ async def retrieve_rag_context(
     Returns:
         Formatted context string with concepts and decision history, or None if nothing found
     """
-    print("\n" + "="*80)
-    print("🔍 CONTEXT RETRIEVAL (Financial Concepts + Decision History)")
-    print("="*80)
-    print(f"Query: {query}")
-    print(
-        f"Parameters: top_k={top_k}, min_score={min_score}, min_concepts={min_concepts}, profile_id={profile_id}")
-    print("-"*80)
+    logger.debug("🔍 CONTEXT RETRIEVAL (Financial Concepts + Decision History)")
+    logger.debug("Query: %s", query)
+    logger.debug(
+        "Parameters: top_k=%s, min_score=%s, min_concepts=%s, profile_id=%s", top_k, min_score, min_concepts, profile_id)
 
     context_parts = []
 
@@ -73,10 +88,10 @@ async def retrieve_rag_context(
     try:
         from rag_service import get_rag_service
         rag = get_rag_service()
-        print("✅ RAG service retrieved successfully")
+        logger.debug("✅ RAG service retrieved successfully")
 
         # For learning moments, retrieve more concepts but ensure quality
-        all_concepts = rag.retrieve_financial_concepts(
+        all_concepts = await rag.retrieve_financial_concepts_async(
             query=query,
             top_k=5
         )
@@ -87,8 +102,8 @@ async def retrieve_rag_context(
         if len(concepts) < 3 and all_concepts:
             concepts = all_concepts[:3]
 
-        print(
-            f"📊 Retrieved {len(concepts) if concepts else 0} financial concepts")
+        logger.debug(
+            "📊 Retrieved %s financial concepts", len(concepts) if concepts else 0)
 
         # if concepts:
         #     for i, c in enumerate(concepts, 1):
@@ -104,15 +119,15 @@ async def retrieve_rag_context(
             if len(above_threshold) >= min_concepts:
                 # We have enough good concepts, use only those above threshold
                 filtered_concepts = above_threshold
-                print(
-                    f"✅ Using {len(filtered_concepts)} concepts above threshold (min_score={min_score})")
+                logger.debug(
+                    "✅ Using %s concepts above threshold (min_score=%s)", len(filtered_concepts), min_score)
             else:
                 # Not enough above threshold, take top min_concepts regardless of score
                 filtered_concepts = concepts[:min_concepts]
                 above_count = len(above_threshold)
                 below_count = len(filtered_concepts) - above_count
-                print(
-                    f"✅ Using {len(filtered_concepts)} concepts: {above_count} above threshold, {below_count} below (guaranteed minimum)")
+                logger.debug(
+                    "✅ Using %s concepts: %s above threshold, %s below (guaranteed minimum)", len(filtered_concepts), above_count, below_count)
 
         # Format retrieved concepts for prompt injection
         if filtered_concepts:
@@ -128,23 +143,17 @@ async def retrieve_rag_context(
             context_parts.append(
                 "=== FINANCIAL KNOWLEDGE ===\n" + "\n\n".join(concept_lines))
         else:
-            print(f"⚠️  No concepts retrieved")
+            logger.debug("⚠️  No concepts retrieved")
 
     except Exception as e:
-        print(f"⚠️ RAG retrieval failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("⚠️ RAG retrieval failed")
 
     # ==========================================
     # Part 2: Player Decision History from SQLite
     # ==========================================
     if include_decisions and profile_id and db_session:
         try:
-            print("\n" + "-"*80)
-            print("🕐 Retrieving player decision history from SQLite...")
-
-            from utils import get_decision_context_for_llm
-            from sqlalchemy.exc import InvalidRequestError
+            logger.debug("🕐 Retrieving player decision history from SQLite...")
 
             decision_context = await get_decision_context_for_llm(
                 profile_id=profile_id,
@@ -156,28 +165,25 @@ async def retrieve_rag_context(
 
             if decision_context and decision_context != "This is the start of the player's journey.":
                 context_parts.append(decision_context)
-                print(
-                    f"✅ Added player decision history ({len(decision_context)} chars)")
+                logger.debug(
+                    "✅ Added player decision history (%s chars)", len(decision_context))
             else:
-                print(f"ℹ️  No decision history yet (new player)")
+                logger.debug("ℹ️  No decision history yet (new player)")
 
         except InvalidRequestError as e:
-            print(f"⚠️ Database session error (session already committed/closed): {e}")
-            print(f"ℹ️  Skipping decision history for this request")
+            logger.warning(
+                "⚠️ Database session error (session already committed/closed): %s", e)
+            logger.debug("ℹ️  Skipping decision history for this request")
         except Exception as e:
-            print(f"⚠️ Decision history retrieval failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("⚠️ Decision history retrieval failed")
 
     # Return combined context or None if nothing was found
     if not context_parts:
-        print(f"ℹ️  No relevant context found")
-        print("="*80 + "\n")
+        logger.debug("ℹ️  No relevant context found")
         return None
 
     result = "\n\n".join(context_parts)
-    print(f"📝 Total context: {len(result)} characters")
-    print("="*80 + "\n")
+    logger.debug("📝 Total context: %s characters", len(result))
     return result
 
 
@@ -207,12 +213,112 @@ OPTIONS_PROMPTS = load_prompt_template("options_prompt.json")
 DYNAMIC_OPTIONS_PROMPTS = load_prompt_template("dynamic_options_prompt.json")
 
 
+# Explicit Gemini context caches for static instruction blocks, keyed by the
+# instruction text: {instruction: (cache_name or None, refresh_at)}. A
+# refresh_at of inf marks an instruction Gemini refused to cache for good.
+_instruction_caches: Dict[str, tuple] = {}
+# One lock per instruction so concurrent requests create a single cache
+_instruction_cache_locks: Dict[str, asyncio.Lock] = {}
+CONTEXT_CACHE_TTL_SECONDS = 3600
+
+
+async def get_instruction_config(
+    client: genai.Client,
+    model: str,
+    instruction: str
+) -> types.GenerateContentConfig:
+    """
+    Build the request config carrying a static instruction block.
+
+    The block is stored once as an explicit context cache and referenced via
+    cached_content, so repeat calls only send the per-turn prompt. Gemini
+    rejects caches below a minimum token count or for models without cache
+    support - then the block is sent as system_instruction, which still keeps
+    it as a stable prefix for implicit caching.
+
+    Args:
+        client: Gemini client
+        model: Model the cache is created for
+        instruction: Static instruction text
+
+    Returns:
+        GenerateContentConfig for generate_content
+    """
+    cache_name, refresh_at = _instruction_caches.get(instruction, (None, 0.0))
+
+    if refresh_at <= time.monotonic():
+        lock = _instruction_cache_locks.setdefault(instruction, asyncio.Lock())
+        async with lock:
+            # Another request may have refreshed it while we waited
+            cache_name, refresh_at = _instruction_caches.get(
+                instruction, (None, 0.0))
+            now = time.monotonic()
+            if refresh_at <= now:
+                try:
+                    cache = await client.aio.caches.create(
+                        model=model,
+                        config=types.CreateCachedContentConfig(
+                            system_instruction=instruction,
+                            ttl=f"{CONTEXT_CACHE_TTL_SECONDS}s"
+                        )
+                    )
+                    cache_name = cache.name
+                    # Recreate shortly before Gemini expires it
+                    refresh_at = now + CONTEXT_CACHE_TTL_SECONDS - 60
+                except errors.ClientError as e:
+                    cache_name = None
+                    if e.code in (408, 429):
+                        refresh_at = now + CONTEXT_CACHE_TTL_SECONDS - 60
+                    else:
+                        # Too few tokens, unsupported model, ... - retrying
+                        # will not help, so stay on system_instruction
+                        logger.info(
+                            "ℹ️  Context cache rejected, sending instruction "
+                            "inline from now on: %s", e)
+                        refresh_at = math.inf
+                except Exception as e:
+                    logger.debug(
+                        "ℹ️  Context cache unavailable, sending instruction inline: %s", e)
+                    cache_name = None
+                    refresh_at = now + CONTEXT_CACHE_TTL_SECONDS - 60
+                _instruction_caches[instruction] = (cache_name, refresh_at)
+
+    if cache_name:
+        return types.GenerateContentConfig(cached_content=cache_name)
+    return types.GenerateContentConfig(system_instruction=instruction)
+
+
+# Connection pool for the Gemini transport - sized for the parallel LLM
+# calls of a step so bursts reuse warm TLS connections
+GEMINI_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=64, max_connections=128)
+
+# HTTP/2 multiplexes the concurrent calls of a step over one connection;
+# httpx needs the optional h2 package for it (httpx[http2])
+try:
+    import h2  # noqa: F401
+    GEMINI_HTTP2 = True
+except ImportError:
+    GEMINI_HTTP2 = False
+
+GEMINI_HTTP_OPTIONS = types.HttpOptions(
+    client_args={"limits": GEMINI_HTTP_LIMITS, "http2": GEMINI_HTTP2},
+    async_client_args={"limits": GEMINI_HTTP_LIMITS, "http2": GEMINI_HTTP2}
+)
+
+_shared_client: Optional[genai.Client] = None
+
+
 def get_ai_client():
-    """Get configured Gemini AI client"""
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        return None
-    return genai.Client(api_key=api_key)
+    """Get the shared Gemini AI client (None if no API key is configured)"""
+    global _shared_client
+    if _shared_client is None:
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            return None
+        _shared_client = genai.Client(
+            api_key=api_key, http_options=GEMINI_HTTP_OPTIONS)
+    return _shared_client
 
 
 async def generate_event_narrative(
@@ -248,9 +354,7 @@ async def generate_event_narrative(
         # RAG-ENHANCED: Retrieve relevant financial concepts + player decision history
         rag_context = None
         if db_session is not None:
-            print("\n" + "#"*80)
-            print(f"📖 EVENT NARRATIVE GENERATION - Context Retrieval")
-            print("#"*80)
+            logger.debug("📖 EVENT NARRATIVE GENERATION - Context Retrieval")
             rag_query = f"{event_type} event. Age {state.current_age}, income €{state.monthly_income}, FI score {state.fi_score:.1f}%, financial knowledge {state.financial_knowledge}/100"
             rag_context = await retrieve_rag_context(
                 query=rag_query,
@@ -265,45 +369,85 @@ async def generate_event_narrative(
             )
 
         if rag_context:
-            print(
-                f"✅ Context WILL BE INJECTED into {event_type} narrative prompt")
+            logger.debug(
+                "✅ Context WILL BE INJECTED into %s narrative prompt", event_type)
         else:
-            print(f"ℹ️  No context - proceeding with standard prompt")
-        print("#"*80 + "\n")
+            logger.debug("ℹ️  No context - proceeding with standard prompt")
 
         prompt = build_narrative_prompt(
             event_type, state, profile, curveball, rag_context)
 
-        print("\n" + "="*80)
-        print(f"🤖 GEMINI API CALL - Event Narrative ({event_type})")
-        print("="*80)
-        print("PROMPT:")
-        print(prompt)
-        print("\n" + "-"*80)
+        logger.debug("🤖 GEMINI API CALL - Event Narrative (%s)", event_type)
+        logger.debug("PROMPT:\n%s", prompt)
 
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model="gemini-2.0-flash-exp",
             contents=prompt
         )
 
-        print("RESPONSE:")
-        print(response.text.strip())
-        print("="*80 + "\n")
+        logger.debug("RESPONSE:\n%s", response.text.strip())
 
         return response.text.strip()
 
     except Exception as e:
-        print(f"AI narrative generation failed: {e}")
+        logger.warning("AI narrative generation failed: %s", e)
         return get_fallback_narrative(event_type, state, curveball)
 
 
+async def stream_event_narrative(
+    event_type: str,
+    state: GameState,
+    profile: PlayerProfile,
+    curveball: Optional[Dict] = None,
+    client: Optional[genai.Client] = None
+) -> AsyncIterator[str]:
+    """
+    Stream the narrative for a game event as Gemini produces it.
+
+    Args:
+        event_type: Type of event
+        state: Current game state
+        profile: Player profile
+        curveball: Optional curveball details
+        client: Gemini client (optional)
+
+    Yields:
+        Narrative text chunks (a single fallback chunk if AI is unavailable)
+    """
+    if client is None:
+        client = get_ai_client()
+
+    if client is None:
+        yield get_fallback_narrative(event_type, state, curveball)
+        return
+
+    prompt = build_narrative_prompt(event_type, state, profile, curveball, None)
+    produced_text = False
+
+    try:
+        stream = await client.aio.models.generate_content_stream(
+            model="gemini-2.0-flash-exp",
+            contents=prompt
+        )
+        async for chunk in stream:
+            if chunk.text:
+                produced_text = True
+                yield chunk.text
+
+    except Exception as e:
+        logger.warning("AI narrative streaming failed: %s", e)
+
+    if not produced_text:
+        yield get_fallback_narrative(event_type, state, curveball)
+
+
 async def generate_consequence_narrative(
     chosen_option: str,
     option_data: Dict,
     state: GameState,
     profile: PlayerProfile,
     event_narrative: str,
-    state_before: Dict,
+    state_before: StateBefore,
     db_session=None,
     client: Optional[genai.Client] = None
 ) -> Dict:
@@ -316,7 +460,7 @@ async def generate_consequence_narrative(
         state: Current game state (BEFORE applying effects)
         profile: Player profile
         event_narrative: The original event narrative
-        state_before: Dict with money_before, investments_before, etc.
+        state_before: StateBefore snapshot (money, investments, etc.)
         db_session: AsyncSession for database access
         client: Gemini client (optional)
 
@@ -368,27 +512,23 @@ async def generate_consequence_narrative(
         #     print(f"ℹ️  No context - proceeding with standard prompt")
         # print("#"*80 + "\n")
 
+        instruction = build_consequence_instruction()
         prompt = build_consequence_prompt(
             chosen_option, option_data, state, profile, event_narrative, state_before, None)
 
-        print("\n" + "="*80)
-        print("🤖 GEMINI API CALL - Consequence Generation")
-        print("="*80)
-        print("PROMPT:")
-        print(prompt)
-        print("\n" + "-"*80)
+        logger.debug("🤖 GEMINI API CALL - Consequence Generation")
+        logger.debug("PROMPT:\n%s", prompt)
 
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model="gemini-2.0-flash-exp",
-            contents=prompt
+            contents=prompt,
+            config=await get_instruction_config(
+                client, "gemini-2.0-flash-exp", instruction)
         )
 
-        print("RESPONSE:")
-        print(response.text.strip())
-        print("="*80 + "\n")
+        logger.debug("RESPONSE:\n%s", response.text.strip())
 
         # Parse JSON response
-        import json
         response_text = response.text.strip()
         # Remove markdown code blocks if present
         if response_text.startswith("```json"):
@@ -402,9 +542,7 @@ async def generate_consequence_narrative(
         return result
 
     except Exception as e:
-        print(f"AI consequence generation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("AI consequence generation failed")
         # Fallback
         return {
             "narrative": "You made your choice and experienced the consequences.",
@@ -423,7 +561,7 @@ async def generate_consequence_narrative(
         }
 
 
-def generate_learning_moment(
+async def generate_learning_moment(
     chosen_option: str,
     state: GameState,
     profile: PlayerProfile,
@@ -443,21 +581,19 @@ def generate_learning_moment(
     """
     # RAG-ENHANCED: Retrieve relevant concepts instead of random chance
     try:
-        print("\n" + "#"*80)
-        print(f"💡 LEARNING MOMENT GENERATION - RAG Enhancement")
-        print("#"*80)
+        logger.debug("💡 LEARNING MOMENT GENERATION - RAG Enhancement")
         from rag_service import get_rag_service
         rag = get_rag_service()
 
         # Build query from context
         query = f"{chosen_option}. Age {state.current_age}, FI score {state.fi_score:.1f}%, financial knowledge {state.financial_knowledge}/100"
-        print(f"🔎 RAG Query: {query}")
+        logger.debug("🔎 RAG Query: %s", query)
         # Retrieve relevant financial concepts
         difficulty = "beginner" if state.financial_knowledge < 50 else "intermediate"
-        print(f"📊 Difficulty filter: {difficulty}")
+        logger.debug("📊 Difficulty filter: %s", difficulty)
 
         # Retrieve more concepts and apply smart filtering
-        all_concepts = rag.retrieve_financial_concepts(
+        all_concepts = await rag.retrieve_financial_concepts_async(
             query=query,
             difficulty_filter=difficulty,
             top_k=5
@@ -469,27 +605,24 @@ def generate_learning_moment(
         if len(concepts) < 3 and all_concepts:
             concepts = all_concepts[:3]
 
-        print(f"📚 Retrieved {len(concepts) if concepts else 0} concepts")
+        logger.debug("📚 Retrieved %s concepts", len(concepts) if concepts else 0)
         if concepts:
             for i, concept in enumerate(concepts, 1):
                 score_marker = "⭐" if concept['score'] >= 0.4 else "📌"
-                print(
-                    f"  {score_marker} {i}. {concept['title']} - Score: {concept['score']:.3f}")
+                logger.debug(
+                    "  %s %s. %s - Score: %.3f", score_marker, i, concept['title'], concept['score'])
 
         # Only generate if we found relevant concepts (score > 0.7 for best match)
         if not concepts or len(concepts) == 0:
-            print(f"⚠️  No concepts retrieved")
-            print("#"*80 + "\n")
+            logger.debug("⚠️  No concepts retrieved")
             return None  # No relevant tip available
 
         if concepts[0]['score'] < 0.7:
-            print(
-                f"⚠️  No concepts above threshold 0.7 (best: {concepts[0]['score']:.3f})")
-            print("#"*80 + "\n")
+            logger.debug(
+                "⚠️  No concepts above threshold 0.7 (best: %.3f)", concepts[0]['score'])
             return None  # No relevant tip available
 
-        print(f"✅ Using concept with score {concepts[0]['score']:.3f}")
-        print("#"*80 + "\n")
+        logger.debug("✅ Using concept with score %.3f", concepts[0]['score'])
 
         if client is None:
             client = get_ai_client()
@@ -497,8 +630,8 @@ def generate_learning_moment(
         if client is None:
             return None
 
-        print(
-            f"🔎 Using concept for learning moment: {concepts[0]['title']} (score: {concepts[0]['score']:.2f})")
+        logger.debug(
+            "🔎 Using concept for learning moment: %s (score: %.2f)", concepts[0]['title'], concepts[0]['score'])
         # Build enhanced prompt with retrieved context
         prompt = f"""You are a friendly financial education coach. Provide a brief, practical tip.
 
@@ -520,31 +653,24 @@ RECENT DECISION:
 Provide a 1-2 sentence tip related to the retrieved concept, tailored to their situation.
 Be encouraging and practical. Make it actionable."""
 
-        print("\n" + "="*80)
-        print("🤖 GEMINI API CALL - Learning Moment (RAG-Enhanced)")
-        print("="*80)
-        print(
-            f"📚 Retrieved concept: {concepts[0]['title']} (score: {concepts[0]['score']:.2f})")
-        print("PROMPT:")
-        print(prompt)
-        print("\n" + "-"*80)
+        logger.debug("🤖 GEMINI API CALL - Learning Moment (RAG-Enhanced)")
+        logger.debug(
+            "📚 Retrieved concept: %s (score: %.2f)", concepts[0]['title'], concepts[0]['score'])
+        logger.debug("PROMPT:\n%s", prompt)
 
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model="gemini-2.0-flash-exp",
             contents=prompt
         )
 
         tip = response.text.strip()
-        print("RESPONSE:")
-        print(tip)
-        print("="*80 + "\n")
+        logger.debug("RESPONSE:\n%s", tip)
 
         return tip
 
     except Exception as e:
-        print(f"⚠️ RAG learning moment failed: {e}")
+        logger.warning("⚠️ RAG learning moment failed: %s", e)
         # Fallback to original 30% random logic
-        import random
         if random.random() > 0.7:
             return None
 
@@ -568,7 +694,7 @@ Be encouraging and practical. Make it actionable."""
 
 {LEARNING_PROMPTS['instruction']}"""
 
-            response = client.models.generate_content(
+            response = await client.aio.models.generate_content(
                 model="gemini-2.0-flash-exp",
                 contents=prompt
             )
@@ -576,11 +702,11 @@ Be encouraging and practical. Make it actionable."""
             return response.text.strip()
 
         except Exception as e2:
-            print(f"Learning moment generation failed: {e2}")
+            logger.warning("Learning moment generation failed: %s", e2)
             return None
 
 
-def generate_option_texts(
+async def generate_option_texts(
     option_descriptions: List[Dict],
     event_type: str,
     state: GameState,
@@ -620,7 +746,6 @@ def generate_option_texts(
         #     print(f"✅ RAG context WILL BE INJECTED into option texts prompt")
         # else:
         #     print(f"ℹ️  No RAG context - proceeding with standard prompt")
-        print("#"*80 + "\n")
 
         # Build prompt for option generation
         options_context = "\n".join([
@@ -660,21 +785,15 @@ Frame the options using this knowledge to make them educational. If past decisio
 
 {OPTIONS_PROMPTS['format_instruction']}"""
 
-        print("\n" + "="*80)
-        print("🤖 GEMINI API CALL - Option Texts")
-        print("="*80)
-        print("PROMPT:")
-        print(prompt)
-        print("\n" + "-"*80)
+        logger.debug("🤖 GEMINI API CALL - Option Texts")
+        logger.debug("PROMPT:\n%s", prompt)
 
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model="gemini-2.0-flash-exp",
             contents=prompt
         )
 
-        print("RESPONSE:")
-        print(response.text.strip())
-        print("="*80 + "\n")
+        logger.debug("RESPONSE:\n%s", response.text.strip())
 
         # Parse the response
         lines = response.text.strip().split('\n')
@@ -694,12 +813,12 @@ Frame the options using this knowledge to make them educational. If past decisio
             return generated_options
 
         # Otherwise fallback to explanations
-        print(
-            f"Warning: Generated {len(generated_options)} options but expected {len(option_descriptions)}, using fallbacks")
+        logger.warning(
+            "Generated %s options but expected %s, using fallbacks", len(generated_options), len(option_descriptions))
         return [opt.get("fallback_text", opt["explanation"]) for opt in option_descriptions]
 
     except Exception as e:
-        print(f"Option text generation failed: {e}")
+        logger.warning("Option text generation failed: %s", e)
         return [opt.get("fallback_text", opt["explanation"]) for opt in option_descriptions]
 
 
@@ -814,10 +933,10 @@ def build_consequence_prompt(
     state: GameState,
     profile: PlayerProfile,
     event_narrative: str,
-    state_before: Dict,
+    state_before: StateBefore,
     rag_context: Optional[str] = None
 ) -> str:
-    """Build prompt for consequence generation (narrative + effects)"""
+    """Build the per-turn prompt for consequence generation (narrative + effects)"""
 
     # Reload prompts to pick up changes
     prompts = get_prompts("consequence_prompt.json")
@@ -838,7 +957,7 @@ Ground your consequence in this knowledge. Consider the player's past patterns a
         city=profile.city,
         education=profile.education_path,
         risk_attitude=profile.risk_attitude,
-        money_before=state_before['money'],
+        money_before=state_before.money,
         monthly_income=state.monthly_income,
         monthly_expenses=state.monthly_expenses,
         expense_housing=state.expense_housing,
@@ -848,23 +967,29 @@ Ground your consequence in this knowledge. Consider the player's past patterns a
         expense_subscriptions=state.expense_subscriptions,
         expense_insurance=state.expense_insurance,
         expense_other=state.expense_other,
-        investments_before=state_before['investments'],
+        investments_before=state_before.investments,
         passive_income=state.passive_income,
         debts=state.debts,
-        fi_score_before=state_before['fi_score'],
-        energy_before=state_before['energy'],
-        motivation_before=state_before['motivation'],
-        social_before=state_before['social'],
-        knowledge_before=state_before['knowledge'],
+        fi_score_before=state_before.fi_score,
+        energy_before=state_before.energy,
+        motivation_before=state_before.motivation,
+        social_before=state_before.social,
+        knowledge_before=state_before.knowledge,
         chosen_option=chosen_option,
         risk_level=option_data.get('risk_level', 'medium'),
         category=option_data.get('category', 'financial'),
         event_narrative=event_narrative
     )
 
+    return f"""{rag_section}
+{prompt_content}"""
+
+
+def build_consequence_instruction() -> str:
+    """Build the static part of the consequence prompt (sent as cached instruction)"""
+    prompts = get_prompts("consequence_prompt.json")
+
     return f"""{prompts['system_context']}
-{rag_section}
-{prompt_content}
 
 {prompts['format_instruction']}"""
 
@@ -893,7 +1018,27 @@ def get_fallback_narrative(
     )
 
 
-def generate_dynamic_options(
+class BundleOption(BaseModel):
+    """A decision option as returned by the options and bundle calls"""
+    text: str
+    risk_level: str
+    category: str
+
+
+# Generated option sets keyed by (event_type, age bucket, narrative hash).
+# Narratives repeat whenever they come from the fallback templates, and the
+# same narrative at the same life stage gets equivalent options.
+dynamic_options_cache = TTLCache(maxsize=2048, ttl=3600)
+
+
+def dynamic_options_cache_key(event_type: str, narrative: str, state: GameState) -> tuple:
+    """Build the dynamic_options_cache key for an event narrative."""
+    narrative_hash = hashlib.blake2b(
+        narrative.encode(), digest_size=8).hexdigest()
+    return (event_type, state.current_age // 5, narrative_hash)
+
+
+async def generate_dynamic_options(
     event_type: str,
     narrative: str,
     state: GameState,
@@ -920,6 +1065,12 @@ def generate_dynamic_options(
     if client is None:
         return generate_fallback_options(event_type, state)
 
+    # Callers annotate the returned dicts, so hand out copies
+    cache_key = dynamic_options_cache_key(event_type, narrative, state)
+    cached_options = dynamic_options_cache.get(cache_key)
+    if cached_options is not None:
+        return copy.deepcopy(cached_options)
+
     try:
         # Reload prompts to get latest version
         DYNAMIC_OPTIONS_PROMPTS = get_prompts("dynamic_options_prompt.json")
@@ -957,70 +1108,159 @@ def generate_dynamic_options(
             narrative=narrative
         )
 
-        prompt = f"""{DYNAMIC_OPTIONS_PROMPTS['system_context']}
+        # Static blocks go into the (cached) instruction, the filled
+        # template is the only per-call content
+        instruction = f"""{DYNAMIC_OPTIONS_PROMPTS['system_context']}
 
 {DYNAMIC_OPTIONS_PROMPTS['instruction']}
 
-{template_filled}
-
 {DYNAMIC_OPTIONS_PROMPTS['format_instruction']}"""
+        prompt = template_filled
 
-        print("\n" + "="*80)
-        print(f"🤖 GEMINI API CALL - Dynamic Options Generation ({event_type})")
-        print("="*80)
-        print("PROMPT:")
-        print(prompt)
-        print("\n" + "-"*80)
+        logger.debug("🤖 GEMINI API CALL - Dynamic Options Generation (%s)", event_type)
+        logger.debug("PROMPT:\n%s", prompt)
 
-        response = client.models.generate_content(
+        # JSON mode with a schema returns a bare array, no markdown fences
+        config = await get_instruction_config(
+            client, "gemini-2.0-flash-exp", instruction)
+        config.response_mime_type = "application/json"
+        config.response_schema = list[BundleOption]
+
+        response = await client.aio.models.generate_content(
             model="gemini-2.0-flash-exp",
-            contents=prompt
+            contents=prompt,
+            config=config
         )
 
-        print("RESPONSE:")
-        print(response.text.strip())
-        print("="*80 + "\n")
+        logger.debug("RESPONSE:\n%s", response.text.strip())
 
-        # Parse JSON response
-        response_text = response.text.strip()
-
-        # Remove markdown code blocks if present
-        if response_text.startswith("```json"):
-            response_text = response_text.split(
-                "```json")[1].split("```")[0].strip()
-        elif response_text.startswith("```"):
-            response_text = response_text.split(
-                "```")[1].split("```")[0].strip()
-
-        options = json.loads(response_text)
+        options = json.loads(response.text)
 
         # Validate that we got a list of options
         if not isinstance(options, list) or len(options) < 2:
-            print(f"Warning: Invalid options format, using fallback")
+            logger.warning("Invalid options format, using fallback")
             return generate_fallback_options(event_type, state)
 
         # Validate each option has required fields (NEW FORMAT: actions only)
         required_fields = ["text", "risk_level", "category"]
         for opt in options:
             if not all(field in opt for field in required_fields):
-                print(
-                    f"Warning: Option missing required fields: {opt.keys()}, using fallback")
+                logger.warning(
+                    "Option missing required fields: %s, using fallback", opt.keys())
                 return generate_fallback_options(event_type, state)
 
-        print(f"✅ Successfully generated {len(options)} dynamic options")
+        logger.debug("✅ Successfully generated %s dynamic options", len(options))
+        dynamic_options_cache.set(cache_key, copy.deepcopy(options))
         return options
 
     except json.JSONDecodeError as e:
-        print(f"JSON parsing error in dynamic options: {e}")
-        print(f"Response was: {response.text[:500]}...")
+        logger.warning("JSON parsing error in dynamic options: %s", e)
+        logger.debug("Response was: %s...", response.text[:500])
         return generate_fallback_options(event_type, state)
     except Exception as e:
-        print(f"Dynamic option generation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Dynamic option generation failed")
         return generate_fallback_options(event_type, state)
 
 
+class EventBundle(BaseModel):
+    """Response schema for generate_event_bundle"""
+    narrative: str
+    options: List[BundleOption]
+
+
+async def generate_event_bundle(
+    event_type: str,
+    state: GameState,
+    profile: PlayerProfile,
+    curveball: Optional[Dict] = None,
+    client: Optional[genai.Client] = None
+) -> tuple:
+    """
+    Generate an event narrative and its decision options in a single call.
+
+    Gemini is asked for a JSON object matching EventBundle, so the options are
+    written against the narrative in the same response instead of a second
+    round-trip. Falls back to the separate narrative/options calls if the
+    bundle cannot be produced or parsed.
+
+    Args:
+        event_type: Type of event
+        state: Current game state
+        profile: Player profile
+        curveball: Optional curveball details
+        client: Gemini client (optional)
+
+    Returns:
+        Tuple of (narrative text, list of option dictionaries)
+    """
+    if client is None:
+        client = get_ai_client()
+
+    if client is None:
+        return (get_fallback_narrative(event_type, state, curveball),
+                generate_fallback_options(event_type, state))
+
+    try:
+        DYNAMIC_OPTIONS_PROMPTS = get_prompts("dynamic_options_prompt.json")
+
+        narrative_prompt = build_narrative_prompt(
+            event_type, state, profile, curveball, None)
+
+        prompt = f"""{narrative_prompt}
+
+EVENT BUNDLE: After writing the narrative, act as the game designer below and create the decision options for it.
+
+{DYNAMIC_OPTIONS_PROMPTS['system_context']}
+
+{DYNAMIC_OPTIONS_PROMPTS['instruction']}
+
+Respond with a JSON object: "narrative" holds the narrative text and "options" holds 2-3 options, each with "text" (15-25 words, the action the player WILL DO), "risk_level" ("low", "medium" or "high") and "category" (e.g. "investment", "savings", "lifestyle", "career", "debt", "social")."""
+
+        logger.debug("🤖 GEMINI API CALL - Event Bundle (%s)", event_type)
+
+        response = await client.aio.models.generate_content(
+            model="gemini-2.0-flash-exp",
+            contents=prompt,
+            config=types.GenerateContentConfig(
+                response_mime_type="application/json",
+                response_schema=EventBundle
+            )
+        )
+
+        logger.debug("RESPONSE:\n%s", response.text.strip())
+
+        bundle = EventBundle.model_validate_json(response.text)
+        if not bundle.narrative.strip() or len(bundle.options) < 2:
+            raise ValueError("bundle is missing the narrative or options")
+
+        options = [option.model_dump() for option in bundle.options]
+        logger.debug("✅ Generated narrative and %s options in one call", len(options))
+        return bundle.narrative.strip(), options
+
+    except ValueError as e:
+        # Also covers pydantic's ValidationError
+        logger.warning("Event bundle was invalid, generating separately: %s", e)
+    except Exception as e:
+        logger.warning("Event bundle generation failed, generating separately: %s", e)
+
+    narrative = await generate_event_narrative(
+        event_type=event_type,
+        state=state,
+        profile=profile,
+        db_session=None,
+        curveball=curveball,
+        client=client
+    )
+    options = await generate_dynamic_options(
+        event_type=event_type,
+        narrative=narrative,
+        state=state,
+        profile=profile,
+        client=client
+    )
+    return narrative, options
+
+
 def generate_fallback_options(event_type: str, state: GameState) -> List[Dict]:
     """
     Generate simple fallback options when AI is not available.
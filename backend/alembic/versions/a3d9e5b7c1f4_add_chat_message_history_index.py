@@ -0,0 +1,31 @@
+"""add chat message history index
+
+Revision ID: a3d9e5b7c1f4
+Revises: f1a7c4e2b8d6
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d9e5b7c1f4'
+down_revision: Union[str, None] = 'f1a7c4e2b8d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Chat history pages filter on the chat session and walk it newest-first,
+    # with the id as tiebreaker for keyset cursors
+    op.create_index('ix_chat_messages_session_created', 'chat_messages',
+                    ['chat_session_id', sa.text('created_at DESC'),
+                     sa.text('id DESC')])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chat_messages_session_created',
+                  table_name='chat_messages')
@@ -0,0 +1,29 @@
+"""add transaction log profile/step index
+
+Revision ID: b6e2f8a4d1c9
+Revises: a3d9e5b7c1f4
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e2f8a4d1c9'
+down_revision: Union[str, None] = 'a3d9e5b7c1f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Transaction logs are fetched per player in step order
+    op.create_index('ix_transaction_logs_profile_step', 'transaction_logs',
+                    ['profile_id', 'step_number'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_transaction_logs_profile_step',
+                  table_name='transaction_logs')
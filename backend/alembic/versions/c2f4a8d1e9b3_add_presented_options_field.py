@@ -0,0 +1,27 @@
+"""add presented_options field
+
+Revision ID: c2f4a8d1e9b3
+Revises: b1234567890a
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f4a8d1e9b3'
+down_revision: Union[str, None] = 'b1234567890a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Options last served to the player, kept so /api/step can read them back
+    op.add_column('game_states', sa.Column('presented_options', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('game_states', 'presented_options')
@@ -0,0 +1,28 @@
+"""add leaderboard final_fi_score index
+
+Revision ID: d5e1b7c3a9f2
+Revises: c2f4a8d1e9b3
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e1b7c3a9f2'
+down_revision: Union[str, None] = 'c2f4a8d1e9b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serve ORDER BY final_fi_score DESC LIMIT n straight from the index
+    op.create_index('ix_leaderboard_final_fi_score', 'leaderboard',
+                    [sa.text('final_fi_score DESC')])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_leaderboard_final_fi_score', table_name='leaderboard')
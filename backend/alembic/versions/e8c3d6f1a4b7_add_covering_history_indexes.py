@@ -0,0 +1,44 @@
+"""add covering decision history and leaderboard indexes
+
+Revision ID: e8c3d6f1a4b7
+Revises: d5e1b7c3a9f2
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c3d6f1a4b7'
+down_revision: Union[str, None] = 'd5e1b7c3a9f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Recent-decision and summary queries filter on profile_id and sort by
+    # step_number; INCLUDE columns only apply on PostgreSQL
+    op.create_index('ix_decision_history_profile_step', 'decision_history',
+                    ['profile_id', sa.text('step_number DESC')],
+                    postgresql_include=['event_type', 'chosen_option',
+                                        'fi_score_before', 'fi_score_after'])
+
+    # Rebuild the leaderboard index so it covers the returned columns
+    op.drop_index('ix_leaderboard_final_fi_score', table_name='leaderboard')
+    op.create_index('ix_leaderboard_final_fi_score', 'leaderboard',
+                    [sa.text('final_fi_score DESC')],
+                    postgresql_include=['player_name', 'balance_score', 'age',
+                                        'education_path', 'completed_at',
+                                        'is_test_mode'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_leaderboard_final_fi_score', table_name='leaderboard')
+    op.create_index('ix_leaderboard_final_fi_score', 'leaderboard',
+                    [sa.text('final_fi_score DESC')])
+
+    op.drop_index('ix_decision_history_profile_step',
+                  table_name='decision_history')
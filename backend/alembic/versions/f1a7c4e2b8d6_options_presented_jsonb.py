@@ -0,0 +1,38 @@
+"""store decision_history.options_presented as JSONB on PostgreSQL
+
+Revision ID: f1a7c4e2b8d6
+Revises: e8c3d6f1a4b7
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a7c4e2b8d6'
+down_revision: Union[str, None] = 'e8c3d6f1a4b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite has a single JSON storage type, so only PostgreSQL changes
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column('decision_history', 'options_presented',
+                    type_=postgresql.JSONB(),
+                    existing_type=sa.JSON(),
+                    postgresql_using='options_presented::jsonb')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column('decision_history', 'options_presented',
+                    type_=sa.JSON(),
+                    existing_type=postgresql.JSONB(),
+                    postgresql_using='options_presented::json')
@@ -8,13 +8,32 @@ Provides:
 """
 
 import bcrypt
+import hashlib
+import os
 import uuid
 from datetime import datetime, timedelta
 from typing import Optional
-from fastapi import HTTPException, Header
+from fastapi import Depends, HTTPException, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
+from database import get_session
 from models import Account, SessionToken
+from cache_utils import TTLCache
+
+
+# Recently validated tokens: token digest -> (account_id, expires_at). Kept
+# short so a token deactivated elsewhere stops working within seconds; logout
+# pops its own token right away. Keys are digests so raw tokens never sit in
+# process memory longer than the request.
+validated_token_cache = TTLCache(maxsize=10_000, ttl=15)
+
+# bcrypt work factor for new hashes; existing hashes keep the cost they were
+# created with, so this can be tuned without resetting passwords
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# bcrypt ignores everything past 72 bytes (and bcrypt>=5 rejects longer
+# input), so passwords are cut to that length the way older hashes were made
+BCRYPT_MAX_PASSWORD_BYTES = 72
 
 
 def hash_password(password: str) -> str:
@@ -27,8 +46,9 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    hashed = bcrypt.hashpw(
+        password.encode('utf-8')[:BCRYPT_MAX_PASSWORD_BYTES], salt)
     return hashed.decode('utf-8')
 
 
@@ -43,7 +63,9 @@ def verify_password(password: str, password_hash: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8'))
+    return bcrypt.checkpw(
+        password.encode('utf-8')[:BCRYPT_MAX_PASSWORD_BYTES],
+        password_hash.encode('utf-8'))
 
 
 def generate_token() -> str:
@@ -84,53 +106,143 @@ async def create_session_token(account_id: int, db_session: AsyncSession, days_v
     return token
 
 
-async def validate_token(token: str, db_session: AsyncSession) -> Optional[Account]:
+async def get_or_create_session_token(
+    account_id: int,
+    db_session: AsyncSession,
+    min_days_left: int = 14
+) -> str:
     """
-    Validate a session token and return the associated account.
+    Reuse the account's newest active session token, or create a new one.
+    
+    Repeated logins then read one row instead of inserting a token each
+    time. A token is only reused while it outlives the 14-day session
+    cookie, so the cookie never outlasts the token behind it.
+    
+    Args:
+        account_id: Account ID
+        db_session: Database session
+        min_days_left: Minimum remaining validity for reuse, in days
+        
+    Returns:
+        Token string
+    """
+    result = await db_session.execute(
+        select(SessionToken.token).where(
+            SessionToken.account_id == account_id,
+            SessionToken.is_active == True,
+            SessionToken.expires_at > datetime.utcnow() + timedelta(days=min_days_left)
+        ).order_by(SessionToken.created_at.desc()).limit(1)
+    )
+    token = result.scalars().first()
+    if token:
+        return token
+    
+    return await create_session_token(account_id, db_session)
+
+
+def _token_cache_key(token: str) -> str:
+    """Digest a session token for use as a validated_token_cache key"""
+    return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+
+def forget_validated_token(token: str) -> None:
+    """
+    Drop a session token from validated_token_cache (e.g. on logout).
+    
+    Args:
+        token: Session token to forget
+    """
+    validated_token_cache.pop(_token_cache_key(token))
+
+
+async def validate_token_account_id(token: str, db_session: AsyncSession) -> Optional[int]:
+    """
+    Validate a session token and return the ID of its account.
+    
+    Served from validated_token_cache without SQL while the entry is fresh.
     
     Args:
         token: Session token to validate
         db_session: Database session
         
     Returns:
-        Account object if valid, None otherwise
+        Account ID if valid, None otherwise
     """
+    cache_key = _token_cache_key(token)
+    cached = validated_token_cache.get(cache_key)
+    if cached is not None and cached[1] >= datetime.utcnow():
+        return cached[0]
+
     # Find the token
     result = await db_session.execute(
         select(SessionToken).where(
             SessionToken.token == token,
             SessionToken.is_active == True
-        )
+        ).limit(1)
     )
-    session_token = result.scalar_one_or_none()
+    session_token = result.scalars().first()
     
     if not session_token:
+        validated_token_cache.pop(cache_key)
         return None
     
     # Check if expired
     if session_token.expires_at < datetime.utcnow():
+        validated_token_cache.pop(cache_key)
         session_token.is_active = False
         await db_session.commit()
         return None
     
-    # Get the account
-    result = await db_session.execute(
-        select(Account).where(Account.id == session_token.account_id)
-    )
-    account = result.scalar_one_or_none()
+    validated_token_cache.set(
+        cache_key, (session_token.account_id, session_token.expires_at))
+    return session_token.account_id
+
+
+async def validate_token(token: str, db_session: AsyncSession) -> Optional[Account]:
+    """
+    Validate a session token and return the associated account.
     
-    return account
+    Args:
+        token: Session token to validate
+        db_session: Database session
+        
+    Returns:
+        Account object if valid, None otherwise
+    """
+    account_id = await validate_token_account_id(token, db_session)
+    if account_id is None:
+        return None
+
+    # Get the account (primary key lookup, served from the identity map
+    # when already loaded)
+    return await db_session.get(Account, account_id)
+
+
+def extract_bearer_token(authorization: Optional[str]) -> Optional[str]:
+    """
+    Extract the token from a "Bearer <token>" Authorization header.
+    
+    Args:
+        authorization: Authorization header value
+        
+    Returns:
+        Token string, or None if the header is missing or not a Bearer header
+    """
+    if not authorization or authorization[:7].lower() != "bearer ":
+        return None
+    return authorization[7:].strip() or None
 
 
 async def get_current_account(
-    authorization: Optional[str] = Header(None)
+    authorization: Optional[str] = Header(None),
+    db_session: AsyncSession = Depends(get_session)
 ) -> Account:
     """
     FastAPI dependency to get the current authenticated account.
     
     Args:
         authorization: Authorization header (Bearer token)
-        db_session: Database session (injected)
+        db_session: Database session (injected, shared with the endpoint)
         
     Returns:
         Account object
@@ -141,41 +253,60 @@ async def get_current_account(
     if not authorization:
         raise HTTPException(status_code=401, detail="Authorization header missing")
     
-    # Parse Bearer token
-    parts = authorization.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        raise HTTPException(status_code=401, detail="Invalid authorization header format")
+    token = extract_bearer_token(authorization)
+    if not token:
+        raise HTTPException(status_code=401, detail="Invalid authorization header")
     
-    token = parts[1]
+    account = await validate_token(token, db_session)
+    if not account:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
     
-    # Need to get db_session here - we'll pass it from the endpoint
-    # This is a simplified version that returns the token for now
-    # The endpoint will need to validate it
-    return token
+    return account
 
 
-async def get_optional_account(
-    authorization: Optional[str] = Header(None)
-) -> Optional[str]:
+async def get_current_account_id(
+    authorization: Optional[str] = Header(None),
+    db_session: AsyncSession = Depends(get_session)
+) -> int:
     """
-    FastAPI dependency to get the current account if authenticated, None otherwise.
-    Used for endpoints that work both with and without authentication (e.g., onboarding).
+    FastAPI dependency to get the authenticated account's ID without
+    loading the account row.
     
     Args:
         authorization: Authorization header (Bearer token)
-        db_session: Database session (injected)
+        db_session: Database session (injected, shared with the endpoint)
         
     Returns:
-        Account object if authenticated, None otherwise
+        Account ID
+        
+    Raises:
+        HTTPException: If token is missing or invalid
     """
     if not authorization:
-        return None
+        raise HTTPException(status_code=401, detail="Authorization header missing")
     
-    # Parse Bearer token
-    parts = authorization.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        return None
+    token = extract_bearer_token(authorization)
+    if not token:
+        raise HTTPException(status_code=401, detail="Invalid authorization header")
     
-    token = parts[1]
-    return token
+    account_id = await validate_token_account_id(token, db_session)
+    if account_id is None:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    
+    return account_id
 
+
+async def get_optional_account(
+    authorization: Optional[str] = Header(None)
+) -> Optional[str]:
+    """
+    FastAPI dependency to get the bearer token if one was sent, None otherwise.
+    Used for endpoints that work both with and without authentication (e.g., onboarding).
+    
+    Args:
+        authorization: Authorization header (Bearer token)
+        
+    Returns:
+        Token string if present, None otherwise
+    """
+    return extract_bearer_token(authorization)
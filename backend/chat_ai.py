@@ -7,25 +7,15 @@ This module handles:
 - Financial guidance tailored to player's situation
 """
 
+import logging
 from typing import Optional
 from google import genai
 from sqlalchemy.ext.asyncio import AsyncSession
 from models import ChatSession, GameState, PlayerProfile
 from chat_utils import get_chat_context_for_llm
-import os
+from ai_narrative import get_ai_client
 
-
-def get_ai_client():
-    """
-    Get Gemini client from environment.
-    
-    Returns:
-        Gemini Client or None if API key not configured
-    """
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        return None
-    return genai.Client(api_key=api_key)
+logger = logging.getLogger(__name__)
 
 
 async def generate_chat_response(
@@ -34,7 +24,8 @@ async def generate_chat_response(
     game_state: GameState,
     profile: PlayerProfile,
     db_session: AsyncSession,
-    client: Optional[genai.Client] = None
+    client: Optional[genai.Client] = None,
+    model: str = "gemini-2.0-flash-exp"
 ) -> str:
     """
     Generate game-aware chat response using Gemini AI.
@@ -52,6 +43,7 @@ async def generate_chat_response(
         profile: Player's profile
         db_session: Database session
         client: Gemini AI client (optional)
+        model: Gemini model to answer with
         
     Returns:
         AI-generated response text
@@ -82,31 +74,24 @@ async def generate_chat_response(
         )
         
         # Log the request
-        print("\n" + "="*80)
-        print("💬 GEMINI API CALL - Chat Response")
-        print("="*80)
-        print("USER MESSAGE:", user_message)
-        print("-"*80)
-        print("CONTEXT LENGTH:", len(context))
-        print("-"*80)
+        logger.debug("💬 GEMINI API CALL - Chat Response (model: %s, context: %d chars)",
+                     model, len(context))
+        logger.debug("USER MESSAGE: %s", user_message)
         
         # Generate response
-        response = client.models.generate_content(
-            model="gemini-2.0-flash-exp",
+        response = await client.aio.models.generate_content(
+            model=model,
             contents=prompt
         )
         
         response_text = response.text.strip()
         
-        print("RESPONSE:", response_text[:200] + "..." if len(response_text) > 200 else response_text)
-        print("="*80 + "\n")
+        logger.debug("RESPONSE: %.200s", response_text)
         
         return response_text
         
     except Exception as e:
-        print(f"❌ Chat AI generation failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Chat AI generation failed")
         return get_fallback_response(user_message, game_state, profile)
 
 
@@ -161,7 +146,7 @@ async def build_chat_context(
             context_parts.append("\n" + decision_context)
             
     except Exception as e:
-        print(f"⚠️ Could not retrieve decision context: {e}")
+        logger.warning("⚠️ Could not retrieve decision context: %s", e)
     
     return "\n\n".join(context_parts)
 
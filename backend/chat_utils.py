@@ -8,16 +8,21 @@ This module contains functions for:
 - Context preparation for LLM
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlmodel import select
 from models import (
     ChatSession, ChatMessage, ChatSummary, ChatRole,
     PlayerProfile, GameState
 )
 from datetime import datetime
+import logging
 import uuid
 
+logger = logging.getLogger(__name__)
+
 
 def generate_chat_session_id() -> str:
     """
@@ -47,9 +52,9 @@ async def get_or_create_chat_session(
     """
     # Try to find existing chat session for this profile
     result = await db_session.execute(
-        select(ChatSession).where(ChatSession.profile_id == profile_id)
+        select(ChatSession).where(ChatSession.profile_id == profile_id).limit(1)
     )
-    chat_session = result.scalar_one_or_none()
+    chat_session = result.scalars().first()
     
     if chat_session:
         return chat_session
@@ -148,7 +153,7 @@ async def get_latest_chat_summary(
         .order_by(ChatSummary.created_at.desc())
         .limit(1)
     )
-    return result.scalar_one_or_none()
+    return result.scalars().first()
 
 
 async def create_chat_summary(
@@ -195,7 +200,7 @@ CONVERSATION:
 
 SUMMARY:"""
         
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model="gemini-2.0-flash-exp",
             contents=prompt
         )
@@ -203,7 +208,7 @@ SUMMARY:"""
         return response.text.strip()
         
     except Exception as e:
-        print(f"⚠️ AI summary failed: {e}")
+        logger.warning("⚠️ AI summary failed: %s", e)
         return create_fallback_summary(messages)
 
 
@@ -247,11 +252,9 @@ async def get_chat_context_for_llm(
     Returns:
         Formatted context string
     """
-    # Get chat session
-    result = await db_session.execute(
-        select(ChatSession).where(ChatSession.id == chat_session_id)
-    )
-    chat_session = result.scalar_one_or_none()
+    # Get chat session (primary key lookup, served from the identity map
+    # when the caller already loaded it)
+    chat_session = await db_session.get(ChatSession, chat_session_id)
     
     if not chat_session:
         return ""
@@ -280,6 +283,47 @@ async def get_chat_context_for_llm(
     return "\n".join(context_parts)
 
 
+async def increment_message_count(
+    chat_session: ChatSession,
+    count: int,
+    updated_at: datetime,
+    db_session: AsyncSession
+) -> int:
+    """
+    Atomically bump a chat session's message counter in the database.
+    
+    The increment runs as ``message_count = message_count + count`` so
+    concurrent requests on the same session cannot lose updates, and the
+    stored value is written back to the loaded object without marking it
+    dirty.
+    
+    Args:
+        chat_session: ChatSession object
+        count: Number of messages added
+        updated_at: New updated_at timestamp
+        db_session: Database session
+        
+    Returns:
+        The new message count
+    """
+    result = await db_session.execute(
+        update(ChatSession)
+        .where(ChatSession.id == chat_session.id)
+        .values(
+            message_count=ChatSession.message_count + count,
+            updated_at=updated_at
+        )
+        .returning(ChatSession.message_count)
+        .execution_options(synchronize_session=False)
+    )
+    message_count = result.scalar_one()
+    
+    set_committed_value(chat_session, "message_count", message_count)
+    set_committed_value(chat_session, "updated_at", updated_at)
+    
+    return message_count
+
+
 async def save_chat_message(
     chat_session: ChatSession,
     role: ChatRole,
@@ -308,14 +352,61 @@ async def save_chat_message(
     )
     
     db_session.add(message)
+    await db_session.flush()
     
-    # Update session metadata
-    chat_session.message_count += 1
-    chat_session.updated_at = datetime.utcnow()
+    await increment_message_count(
+        chat_session, 1, datetime.utcnow(), db_session)
     
+    return message
+
+
+async def save_chat_exchange(
+    chat_session: ChatSession,
+    user_content: str,
+    assistant_content: str,
+    db_session: AsyncSession,
+    asked_at: Optional[datetime] = None,
+    message_metadata: dict = None
+) -> Tuple[ChatMessage, ChatMessage]:
+    """
+    Save a user message and the assistant reply with a single flush.
+    
+    Both rows go out as one batched INSERT ... RETURNING, and the session
+    counter is bumped once for the pair.
+    
+    Args:
+        chat_session: ChatSession object
+        user_content: The user's message
+        assistant_content: The AI response
+        db_session: Database session
+        asked_at: When the user sent the message (default: now)
+        message_metadata: Optional metadata dictionary for both messages
+        
+    Returns:
+        Tuple of (user ChatMessage, assistant ChatMessage)
+    """
+    now = datetime.utcnow()
+    user_message = ChatMessage(
+        chat_session_id=chat_session.id,
+        role=ChatRole.USER,
+        content=user_content,
+        message_metadata=dict(message_metadata or {}),
+        created_at=asked_at or now
+    )
+    assistant_message = ChatMessage(
+        chat_session_id=chat_session.id,
+        role=ChatRole.ASSISTANT,
+        content=assistant_content,
+        message_metadata=dict(message_metadata or {}),
+        created_at=now
+    )
+    
+    db_session.add_all([user_message, assistant_message])
     await db_session.flush()
     
-    return message
+    await increment_message_count(chat_session, 2, now, db_session)
+    
+    return user_message, assistant_message
 
 
 async def should_create_summary(chat_session: ChatSession) -> bool:
@@ -10,6 +10,7 @@ This module handles:
 from sqlmodel import SQLModel, create_engine, Session
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 import os
@@ -32,11 +33,36 @@ sync_engine = create_engine(
         "check_same_thread": False} if "sqlite" in DATABASE_URL else {}
 )
 
+# asyncpg can reuse server-side prepared statements across executions
+async_connect_args = {}
+if ASYNC_DATABASE_URL.startswith("postgresql+asyncpg"):
+    async_connect_args["prepared_statement_cache_size"] = int(
+        os.getenv("DB_STATEMENT_CACHE_SIZE", "1024"))
+
+# Connection pool sized for concurrent game sessions
+async_pool_options = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "40")),
+    # Recycling retires connections before server/proxy idle timeouts
+    "pool_recycle": 1800,
+}
+if ASYNC_DATABASE_URL.startswith("sqlite"):
+    # aiosqlite defaults to NullPool, which opens a new connection (and
+    # worker thread) for every session - keep connections open instead
+    async_pool_options["poolclass"] = AsyncAdaptedQueuePool
+else:
+    # Pre-ping costs a round-trip on every checkout; opt in where the
+    # server drops connections more often than pool_recycle
+    async_pool_options["pool_pre_ping"] = os.getenv(
+        "DB_POOL_PRE_PING", "false").lower() == "true"
+
 # Create async engine for async operations
 async_engine = create_async_engine(
     ASYNC_DATABASE_URL,
     echo=False,  # Set to False in production
-    future=True
+    future=True,
+    connect_args=async_connect_args,
+    **async_pool_options
 )
 
 # Create async session maker
@@ -4,9 +4,12 @@ Translates LLM qualitative outcomes into MCP financial calculations
 Uses MCP client to communicate with standalone MCP server
 """
 
+import logging
 from typing import Dict, Optional
 from mcp_client import get_mcp_client
 
+logger = logging.getLogger(__name__)
+
 
 async def parse_llm_outcome(llm_response: Dict) -> Dict[str, float]:
     """
@@ -18,13 +21,13 @@ async def parse_llm_outcome(llm_response: Dict) -> Dict[str, float]:
     Returns:
         Dictionary of calculated effects to apply to GameState
     """
-    print(f"[FINANCIAL_CALC] DEBUG - Parsing LLM response:")
-    print(f"  Keys in response: {llm_response.keys()}")
+    logger.debug("Parsing LLM response:")
+    logger.debug("  Keys in response: %s", llm_response.keys())
     
     # Check if LLM returned old format with 'effects' instead of 'outcome'
     if 'effects' in llm_response and 'outcome' not in llm_response:
-        print(f"  ⚠️  LLM returned OLD format with 'effects' - prompt not updated!")
-        print(f"  Using legacy effects directly without MCP calculation")
+        logger.debug("  ⚠️  LLM returned OLD format with 'effects' - prompt not updated!")
+        logger.debug("  Using legacy effects directly without MCP calculation")
         # Return the effects as-is (old behavior)
         old_effects = llm_response['effects']
         return {
@@ -49,8 +52,8 @@ async def parse_llm_outcome(llm_response: Dict) -> Dict[str, float]:
     outcome = llm_response.get("outcome", {})
     action_type = outcome.get("action_type", "")
     
-    print(f"  Outcome found: {bool(outcome)}")
-    print(f"  Action type: {action_type}")
+    logger.debug("  Outcome found: %s", bool(outcome))
+    logger.debug("  Action type: %s", action_type)
     
     # Initialize effects
     effects = {
@@ -96,7 +99,7 @@ async def parse_llm_outcome(llm_response: Dict) -> Dict[str, float]:
                 
             except (ValueError, KeyError) as e:
                 # Log error but don't crash - fall back to no financial effects
-                print(f"[WARNING] Investment calculation failed: {e}")
+                logger.warning("Investment calculation failed: %s", e)
     
     # Handle expense changes
     elif action_type == "expense":
@@ -157,14 +160,16 @@ async def validate_and_log_transaction(
     message = validation_result['message']
     
     if not is_valid:
-        print(f"[ERROR] Balance sheet validation failed: {message}")
-        print(f"  Money: {money_before} -> {money_before + money_change}")
-        print(f"  Investments: {investments_before} -> {investments_before + investment_change}")
-        print(f"  Wealth change: {(money_before + money_change + investments_before + investment_change) - (money_before + investments_before)}")
+        logger.error("Balance sheet validation failed: %s", message)
+        logger.debug("  Money: %s -> %s", money_before, money_before + money_change)
+        logger.debug(
+            "  Investments: %s -> %s", investments_before, investments_before + investment_change)
+        logger.debug(
+            "  Wealth change: %s", (money_before + money_change + investments_before + investment_change) - (money_before + investments_before))
         return False
     
     # Log successful validation
-    print(f"[INFO] Transaction validated: {message}")
+    logger.debug("Transaction validated: %s", message)
     return True
 
 
@@ -191,7 +196,7 @@ async def calculate_effects_from_llm(
     if not is_valid:
         # Return effects anyway but log the error
         # In production, you might want to reject the transaction
-        print("[WARNING] Proceeding with invalid transaction - review logs")
+        logger.warning("Proceeding with invalid transaction - review logs")
     
     return effects
 
@@ -8,7 +8,9 @@ This module contains the core game logic:
 - Monthly phase-based progression (3 steps per month)
 """
 
+from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
+import logging
 import random
 from models import GameState, PlayerProfile, RiskAttitude
 from utils import (
@@ -23,6 +25,8 @@ from expense_constraints import (
     get_expense_warning
 )
 
+logger = logging.getLogger(__name__)
+
 
 # Event types organized by month phase
 PHASE_1_EVENTS = [
@@ -57,6 +61,18 @@ def get_current_month_name(months_passed: int) -> str:
     return month_names[months_passed % 12]
 
 
+@dataclass(slots=True)
+class StateBefore:
+    """Snapshot of the game state metrics taken before a decision is applied"""
+    money: float
+    investments: float
+    fi_score: float
+    energy: int
+    motivation: int
+    social: int
+    knowledge: int
+
+
 class DecisionEffect:
     """Represents the effects of a decision on game state"""
 
@@ -129,7 +145,7 @@ def create_transaction_description(effect: DecisionEffect) -> str:
     return "; ".join(changes) if changes else "No financial changes"
 
 
-def apply_monthly_cash_flow(state: GameState) -> Dict:
+def apply_monthly_cash_flow(state: GameState) -> Tuple[bool, Optional[Dict]]:
     """
     Apply monthly income and expenses at the start of each month (phase 1 only).
 
@@ -137,18 +153,12 @@ def apply_monthly_cash_flow(state: GameState) -> Dict:
         state: Current game state
 
     Returns:
-        Dictionary with cash flow transaction details
+        Tuple of (applied, cash flow transaction details); the details are
+        None when no cash flow was applied this step
     """
     # Only apply on phase 1 (start of month)
     if state.month_phase != 1:
-        return {
-            "cash_change": 0,
-            "income_received": 0,
-            "expenses_paid": 0,
-            "debt_from_deficit": 0,
-            "cash_balance": state.money,
-            "applied": False
-        }
+        return False, None
 
     # Calculate total monthly income (salary + passive income)
     total_income = state.monthly_income + state.passive_income
@@ -157,12 +167,12 @@ def apply_monthly_cash_flow(state: GameState) -> Dict:
     state.money += total_income
     state.money -= state.monthly_expenses
 
-    print(
-        f"💰 MONTHLY CASH FLOW (New Month - {get_current_month_name(state.months_passed)}):")
-    print(f"  Income: €{total_income:.0f}")
-    print(f"  Expenses: €{state.monthly_expenses:.0f}")
-    print(f"  Net: €{total_income - state.monthly_expenses:.0f}")
-    print(f"  Cash balance: €{state.money:.0f}")
+    logger.debug(
+        "💰 MONTHLY CASH FLOW (New Month - %s):", get_current_month_name(state.months_passed))
+    logger.debug("  Income: €%.0f", total_income)
+    logger.debug("  Expenses: €%.0f", state.monthly_expenses)
+    logger.debug("  Net: €%.0f", total_income - state.monthly_expenses)
+    logger.debug("  Cash balance: €%.0f", state.money)
 
     # Convert negative cash to debt if needed
     debt_from_deficit = 0
@@ -171,16 +181,15 @@ def apply_monthly_cash_flow(state: GameState) -> Dict:
         state.debts += deficit
         debt_from_deficit = deficit
         state.money = 0
-        print(
-            f"💳 Converted €{deficit:.0f} negative cash to debt. Total debt now: €{state.debts:.0f}")
+        logger.debug(
+            "💳 Converted €%.0f negative cash to debt. Total debt now: €%.0f", deficit, state.debts)
 
-    return {
+    return True, {
         "cash_change": total_income - state.monthly_expenses,
         "income_received": total_income,
         "expenses_paid": state.monthly_expenses,
         "debt_from_deficit": debt_from_deficit,
-        "cash_balance": state.money,
-        "applied": True
+        "cash_balance": state.money
     }
 
 
@@ -268,10 +277,6 @@ def apply_decision_effects(state: GameState, effect: DecisionEffect) -> Dict:
         "other": (state.expense_other, effect.expense_other_change)
     }
 
-    # Get player's profile to access city info (for validation)
-    from database import async_session_maker
-    import asyncio
-
     for category, (current_value, change) in expense_categories.items():
         if change != 0:
             # Validate the change against minimums
@@ -323,14 +328,14 @@ def apply_decision_effects(state: GameState, effect: DecisionEffect) -> Dict:
             # Store warning if hit minimum
             if warning:
                 expense_warnings.append(warning)
-                print(f"⚠️ {warning}")
+                logger.warning("⚠️ %s", warning)
 
             # Check for ongoing health warnings
             new_value = current_value + actual_change
             health_warning = get_expense_warning(category, new_value)
             if health_warning and health_warning not in expense_warnings:
                 expense_warnings.append(health_warning)
-                print(f"💔 {health_warning}")
+                logger.debug("💔 %s", health_warning)
 
     # Recalculate total monthly expenses from categories
     state.monthly_expenses = (state.expense_housing + state.expense_food +
@@ -345,8 +350,8 @@ def apply_decision_effects(state: GameState, effect: DecisionEffect) -> Dict:
         state.debts += deficit
         debt_change += deficit  # Update debt_change to reflect conversion
         state.money = 0
-        print(
-            f"💳 Converted €{deficit:.0f} negative cash to debt. Total debt now: €{state.debts:.0f}")
+        logger.debug(
+            "💳 Converted €%.0f negative cash to debt. Total debt now: €%.0f", deficit, state.debts)
 
     # Update life metrics with bounds checking
     state.energy = update_metric(state.energy, effect.energy_change)
@@ -359,7 +364,7 @@ def apply_decision_effects(state: GameState, effect: DecisionEffect) -> Dict:
     # Apply recurring benefits from active subscriptions
     subscription_benefits = apply_subscription_benefits(state)
     if subscription_benefits:
-        print(f"✨ Subscription benefits applied: {subscription_benefits}")
+        logger.debug("✨ Subscription benefits applied: %s", subscription_benefits)
 
     # Update assets
     for key, value in effect.asset_updates.items():
@@ -391,8 +396,8 @@ def apply_decision_effects(state: GameState, effect: DecisionEffect) -> Dict:
 
         state.years_passed = state.months_passed / 12.0
 
-    print(
-        f"⏰ TIME: Step {state.current_step}, Month {state.months_passed} (Phase {state.month_phase}/3)")
+    logger.debug(
+        "⏰ TIME: Step %s, Month %s (Phase %s/3)", state.current_step, state.months_passed, state.month_phase)
 
     # Return transaction summary
     return {
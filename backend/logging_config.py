@@ -0,0 +1,58 @@
+"""
+Logging setup for the LifeSim API.
+
+This module handles:
+- Routing all log records through a QueueHandler, message rendered but
+  stack traces left unformatted
+- Formatting and writing records on a background QueueListener thread
+- Reading the log level from the LOG_LEVEL environment variable
+"""
+
+import copy
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """
+    QueueHandler that freezes the message but defers the stack trace.
+
+    The stock prepare() formats the whole record (stack trace included) in
+    the logging thread. Here only msg % args is rendered, so mutable args
+    and ORM objects are read on their own thread, and exc_info is left for
+    the listener's handler to format.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def configure_logging() -> QueueListener:
+    """
+    Install a queue-backed root handler so formatting stack traces and
+    writing to stderr never happens on the event loop thread.
+
+    Returns:
+        The started QueueListener (stop it on shutdown to flush records)
+    """
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(
+        "%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        handlers=[DeferredFormatQueueHandler(log_queue)],
+        force=True
+    )
+
+    listener = QueueListener(
+        log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
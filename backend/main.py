@@ -1,47 +1,70 @@
-from fastapi import FastAPI, HTTPException, Depends, Header, Cookie, Response
+from fastapi import (
+    FastAPI, HTTPException, Depends, Header, Cookie, Response, BackgroundTasks,
+    Query
+)
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Set
 from datetime import datetime
 import os
+import hashlib
 import time
+import asyncio
+import logging
+import orjson
 from contextlib import contextmanager
 from dotenv import load_dotenv
+from logging_config import configure_logging
 from google import genai
 from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
-from database import init_db, close_db, get_session
+from sqlalchemy import bindparam, func, true, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
+from database import init_db, close_db, get_session, async_session_maker
+from cache_utils import TTLCache
 from models import (
     PlayerProfile, GameState, DecisionHistory, LeaderboardEntry, TransactionLog,
     OnboardingRequest, GameStateResponse, OnboardingResponse, GameStatus,
     DecisionRequest, DecisionResponse, ChatRequest, ChatResponse,
-    ChatHistoryResponse, ChatMessageResponse, ChatRole, ChatSession, ChatMessage,
+    ChatHistoryResponse, ChatMessageResponse, ChatSession, ChatMessage,
     LifeMetricsChanges, TransactionSummary, MonthlyCashFlowSummary,
     UpdateExpensesRequest, UpdateExpensesResponse
 )
-from utils import initialize_game_state, generate_session_id, calculate_fi_score
+from utils import (
+    initialize_game_state, generate_session_id, calculate_fi_score,
+    count_decisions_capped, create_decision_summary,
+    load_decision_summary_stats, DECISION_SUMMARY_THRESHOLD
+)
 from game_engine import (
     get_event_type, create_decision_options, apply_decision_effects,
-    setup_option_effect, generate_curveball_event, setup_dynamic_option_effect
+    setup_option_effect, generate_curveball_event, setup_dynamic_option_effect,
+    StateBefore, apply_monthly_cash_flow, get_month_phase_name,
+    get_current_month_name
 )
 from ai_narrative import (
-    generate_event_narrative, generate_consequence_narrative,
-    generate_learning_moment, generate_dynamic_options, get_ai_client
+    generate_consequence_narrative,
+    generate_learning_moment, generate_dynamic_options, get_ai_client,
+    stream_event_narrative, generate_event_bundle, dynamic_options_cache
 )
 from financial_calculator import calculate_effects_from_llm
 from mcp_client import close_mcp_client
 from rag_service import RAGService, get_rag_service
 import rag_service as rag_module
 from chat_utils import (
-    get_or_create_chat_session, save_chat_message, should_create_summary,
+    get_or_create_chat_session, save_chat_exchange, should_create_summary,
     create_chat_summary, store_chat_summary, get_recent_chat_messages,
     get_latest_chat_summary
 )
 from chat_ai import generate_chat_response
 from auth_utils import (
     hash_password, verify_password, create_session_token,
-    validate_token, get_current_account, get_optional_account
+    get_or_create_session_token,
+    validate_token, get_current_account, get_current_account_id,
+    get_optional_account,
+    validated_token_cache, forget_validated_token, extract_bearer_token
 )
 from models import (
     Account, SessionToken, RegisterRequest, LoginRequest,
@@ -50,6 +73,9 @@ from models import (
 
 load_dotenv()
 
+log_listener = configure_logging()
+logger = logging.getLogger(__name__)
+
 
 # =====================================================
 # Performance Monitoring - Easy to remove
@@ -62,7 +88,7 @@ def timer(operation_name: str):
         yield
     finally:
         duration = time.time() - start
-        print(f"⏱️  {operation_name}: {duration:.3f}s")
+        logger.debug("⏱️  %s: %.3fs", operation_name, duration)
 # =====================================================
 
 
@@ -73,24 +99,27 @@ async def lifespan(app: FastAPI):
     Initializes database on startup and closes connections on shutdown.
     """
     # Startup
-    print("🚀 Starting up LifeSim API...")
+    logger.info("🚀 Starting up LifeSim API...")
     await init_db()
 
     # Initialize RAG service
     try:
         rag_module.rag_service = RAGService(
             chroma_host="chromadb", chroma_port=8000)
-        print("✅ RAG Service initialized")
+        logger.info("✅ RAG Service initialized")
     except Exception as e:
-        print(f"⚠️ RAG Service failed to initialize: {e}")
-        print("   Game will continue without RAG-enhanced learning moments")
+        logger.warning(
+            "⚠️ RAG Service failed to initialize: %s. Game will continue "
+            "without RAG-enhanced learning moments", e)
         rag_module.rag_service = None
 
     yield
     # Shutdown
-    print("👋 Shutting down LifeSim API...")
+    logger.info("👋 Shutting down LifeSim API...")
     await close_mcp_client()
     await close_db()
+    rag_module.RAG_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    log_listener.stop()
 
 
 app = FastAPI(
@@ -125,15 +154,238 @@ app = FastAPI(
     docs_url="/docs",  # Swagger UI
     redoc_url="/redoc",  # ReDoc alternative documentation
     openapi_url="/openapi.json",  # OpenAPI schema
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # Configure Gemini API
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-if GEMINI_API_KEY:
-    client = genai.Client(api_key=GEMINI_API_KEY)
-else:
-    client = None
+client = get_ai_client()
+
+# Prebuilt statements for the hot lookups - built once at import so
+# handlers only bind parameters
+PROFILE_AND_STATE_BY_SESSION_ID = (
+    select(PlayerProfile, GameState)
+    .join(GameState, GameState.profile_id == PlayerProfile.id)
+    .where(PlayerProfile.session_id == bindparam("session_id"))
+    .limit(1)
+)
+PROFILE_ID_BY_SESSION_ID = select(PlayerProfile.id).where(
+    PlayerProfile.session_id == bindparam("session_id")).limit(1)
+USERNAME_EXISTS = select(Account.id).where(
+    Account.username == bindparam("username")).exists()
+CHAT_SESSION_BY_SESSION_ID = (
+    select(ChatSession)
+    .join(PlayerProfile, PlayerProfile.id == ChatSession.profile_id)
+    .where(PlayerProfile.session_id == bindparam("session_id"))
+    .limit(1)
+)
+
+
+async def load_session(db_session: AsyncSession, session_id: str):
+    """
+    Load a session's profile and game state with one joined query.
+
+    Returns:
+        (profile, game_state)
+
+    Raises:
+        HTTPException: 404 if the session does not exist
+    """
+    result = await db_session.execute(
+        PROFILE_AND_STATE_BY_SESSION_ID, {"session_id": session_id}
+    )
+    # session_id is unique, so the first row is the only row
+    row = result.first()
+
+    if not row:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    return tuple(row)
+
+
+async def load_session_with_decisions(
+    db_session: AsyncSession, session_id: str, limit: Optional[int]
+):
+    """
+    Load a session's profile, game state, recent decisions and total decision
+    count with one query.
+
+    The newest decisions (with a COUNT(*) OVER () total) come from a limited
+    subquery that is outer-joined onto the profile/game state row, so a
+    session without decisions still returns its row.
+
+    Returns:
+        (profile, game_state, decisions oldest first, total decisions)
+
+    Raises:
+        HTTPException: 404 if the session does not exist
+    """
+    recent = (
+        select(DecisionHistory, func.count().over().label("total_decisions"))
+        .join(PlayerProfile, DecisionHistory.profile_id == PlayerProfile.id)
+        .where(PlayerProfile.session_id == session_id)
+        .order_by(DecisionHistory.step_number.desc())
+        .limit(limit)
+        .subquery()
+    )
+    recent_decision = aliased(DecisionHistory, recent)
+
+    result = await db_session.execute(
+        select(PlayerProfile, GameState, recent_decision,
+               recent.c.total_decisions)
+        .join(GameState, GameState.profile_id == PlayerProfile.id)
+        .outerjoin(recent, true())
+        .where(PlayerProfile.session_id == session_id)
+        .order_by(recent.c.step_number)
+    )
+    rows = result.all()
+
+    if not rows:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    profile, game_state = rows[0][0], rows[0][1]
+    decisions = [row[2] for row in rows if row[2] is not None]
+    if decisions:
+        total_decisions = rows[0][3]
+    elif limit == 0:
+        # A zero limit returns no rows to carry the window count
+        total_decisions = await count_decisions_capped(
+            profile.id, db_session, cap=None)
+    else:
+        total_decisions = 0
+
+    return profile, game_state, decisions, total_decisions
+
+
+# Serialized GameStateResponse JSON per session_id, written through by
+# build_state_response from every endpoint that mutates a game state - the
+# TTL only bounds how long idle sessions occupy the cache.
+game_state_cache = TTLCache(maxsize=10_000, ttl=300)
+
+
+# GameStateResponse fields copied from the GameState row
+GAME_STATE_RESPONSE_FIELDS = tuple(
+    name for name in GameStateResponse.model_fields if name != "session_id")
+
+
+def build_state_response(game_state: GameState, session_id: str) -> GameStateResponse:
+    """
+    Build the GameStateResponse for a game state and cache its serialized
+    JSON for get_game_state.
+
+    The values come from a GameState that was validated on its way into the
+    database, so model_construct skips re-running the validators.
+    """
+    state_response = GameStateResponse.model_construct(
+        session_id=session_id,
+        **{name: getattr(game_state, name) for name in GAME_STATE_RESPONSE_FIELDS}
+    )
+    game_state_cache.set(session_id, state_response.model_dump_json().encode())
+    return state_response
+
+
+# Rendered leaderboard JSON and its ETag, keyed by (limit, include_test_mode).
+# Entries are written rarely (on game completion), so a minute of staleness is
+# fine - clients and CDNs may cache the response for as long.
+leaderboard_cache = TTLCache(maxsize=256, ttl=60)
+LEADERBOARD_CACHE_CONTROL = "public, max-age=60"
+
+def leaderboard_response(
+    content: bytes, etag: str, if_none_match: Optional[str]
+) -> Response:
+    """
+    Build the leaderboard response, or a 304 when the client has this version.
+
+    Args:
+        content: Rendered leaderboard JSON
+        etag: Quoted ETag for content
+        if_none_match: The request's If-None-Match header
+
+    Returns:
+        Response with the JSON body, or an empty 304 Not Modified
+    """
+    headers = {"ETag": etag, "Cache-Control": LEADERBOARD_CACHE_CONTROL}
+    if if_none_match and (
+            if_none_match.strip() == "*"
+            or etag in (tag.strip() for tag in if_none_match.split(","))):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=content, media_type="application/json", headers=headers)
+
+
+def cache_leaderboard(cache_key: tuple, content: bytes) -> str:
+    """
+    Store rendered leaderboard JSON with a content-derived ETag.
+
+    Args:
+        cache_key: (limit, include_test_mode)
+        content: Rendered leaderboard JSON
+
+    Returns:
+        The quoted ETag
+    """
+    etag = '"%s"' % hashlib.blake2b(content, digest_size=16).hexdigest()
+    leaderboard_cache.set(cache_key, (etag, content))
+    return etag
+
+
+# Top-N leaderboard rows per include_test_mode flag. limit is capped at
+# LEADERBOARD_TOP_N, so every request is a slice of one query.
+LEADERBOARD_TOP_N = 100
+leaderboard_top_cache = TTLCache(maxsize=4, ttl=60)
+
+
+# session_id -> profile_id. The mapping never changes once the profile is
+# created, so the TTL only bounds how long idle sessions occupy the cache.
+profile_id_cache = TTLCache(maxsize=10_000, ttl=24 * 3600)
+
+
+async def resolve_profile_id(session_id: str, db_session: AsyncSession) -> Optional[int]:
+    """
+    Resolve a session_id to its profile id, querying only on a cache miss.
+
+    Returns:
+        The profile id, or None if no profile has this session_id
+    """
+    profile_id = profile_id_cache.get(session_id)
+    if profile_id is None:
+        result = await db_session.execute(
+            PROFILE_ID_BY_SESSION_ID, {"session_id": session_id}
+        )
+        profile_id = result.scalars().first()
+        if profile_id is not None:
+            profile_id_cache.set(session_id, profile_id)
+    return profile_id
+
+
+# Column snapshots of each live session's PlayerProfile and GameState for the
+# read-only endpoints. Written through after every commit that changes the
+# state. Writers always SELECT the current row: another instance may have
+# advanced the session since this snapshot was taken.
+session_state_cache = TTLCache(maxsize=10_000, ttl=600)
+
+
+def remember_session_state(session_id: str, profile: PlayerProfile, game_state: GameState):
+    """Snapshot committed profile and game state columns for the session."""
+    session_state_cache.set(
+        session_id, (profile.model_dump(), game_state.model_dump()))
+
+
+def peek_session_state(session_id: str):
+    """
+    Read-only copies of the session's profile and game state from the
+    snapshot cache, for endpoints that never write them back.
+
+    Returns:
+        (profile, game_state) not attached to any session, or None on a miss
+    """
+    snapshot = session_state_cache.get(session_id)
+    if snapshot is None:
+        return None
+
+    profile_data, state_data = snapshot
+    return PlayerProfile(**profile_data), GameState(**state_data)
+
 
 # CORS middleware for React frontend
 # Allow Cloud Run frontend URLs and local development
@@ -149,9 +401,9 @@ allowed_origins = [
 frontend_url = os.getenv("FRONTEND_URL", "")
 if frontend_url:
     allowed_origins.append(frontend_url)
-    print(f"✅ CORS: Added frontend URL: {frontend_url}")
+    logger.info("✅ CORS: Added frontend URL: %s", frontend_url)
 
-print(f"🌐 CORS allowed origins: {allowed_origins}")
+logger.info("🌐 CORS allowed origins: %s", allowed_origins)
 
 app.add_middleware(
     CORSMiddleware,
@@ -171,12 +423,28 @@ def on_startup():
     pass
 
 
+AVAILABLE_MODELS = [
+    {"id": "gemini-2.0-flash-exp",
+        "name": "Gemini 2.0 Flash (Experimental)"},
+    {"id": "gemini-1.5-pro", "name": "Gemini 1.5 Pro"},
+    {"id": "gemini-1.5-flash", "name": "Gemini 1.5 Flash"},
+    {"id": "gemini-pro", "name": "Gemini Pro"},
+]
+VALID_GEMINI_MODELS = frozenset(model["id"] for model in AVAILABLE_MODELS)
+DEFAULT_CHAT_MODEL = "gemini-2.0-flash-exp"
+
+# Static payloads are serialized once at import time
+_ROOT_JSON = orjson.dumps({"message": "AI Hackathon API is running!"})
+_HEALTH_JSON = orjson.dumps({"status": "healthy"})
+_MODELS_JSON = orjson.dumps({"models": AVAILABLE_MODELS})
+
+
 @app.get("/", tags=["System"])
 async def root():
     """
     Root endpoint - API welcome message
     """
-    return {"message": "AI Hackathon API is running!"}
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 
 @app.get("/health", tags=["System"])
@@ -184,7 +452,25 @@ async def health():
     """
     Health check endpoint - verify API is operational
     """
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_JSON, media_type="application/json")
+
+
+@app.get("/metrics", tags=["System"])
+async def metrics():
+    """
+    In-process cache statistics (size, hits, misses) per cache
+    """
+    return {
+        "caches": {
+            "game_state": game_state_cache.stats(),
+            "session_state": session_state_cache.stats(),
+            "profile_id": profile_id_cache.stats(),
+            "leaderboard": leaderboard_cache.stats(),
+            "leaderboard_top": leaderboard_top_cache.stats(),
+            "validated_token": validated_token_cache.stats(),
+            "dynamic_options": dynamic_options_cache.stats(),
+        }
+    }
 
 
 # =====================================================
@@ -217,18 +503,18 @@ async def register(
     **Returns:** Auth token and account information
     """
     try:
-        # Check if username already exists
-        result = await db_session.execute(
-            select(Account).where(Account.username == request.username.lower())
+        # Check if username already exists (index-only EXISTS probe)
+        username_taken = await db_session.scalar(
+            select(USERNAME_EXISTS),
+            {"username": request.username.lower()}
         )
-        existing_account = result.scalar_one_or_none()
 
-        if existing_account:
+        if username_taken:
             raise HTTPException(
                 status_code=400, detail="Username already taken")
 
-        # Hash password
-        password_hash = hash_password(request.password)
+        # Hash password - bcrypt is CPU-bound, keep it off the event loop
+        password_hash = await asyncio.to_thread(hash_password, request.password)
 
         # Create account
         account = Account(
@@ -239,15 +525,21 @@ async def register(
         )
 
         db_session.add(account)
-        await db_session.flush()
+        try:
+            await db_session.flush()
+        except IntegrityError:
+            # Lost a race with a concurrent registration of the same name
+            await db_session.rollback()
+            raise HTTPException(
+                status_code=400, detail="Username already taken")
 
         # Create session token
         token = await create_session_token(account.id, db_session)
 
         await db_session.commit()
 
-        print(
-            f"✅ Registered new account: {account.username} (ID: {account.id})")
+        logger.info("✅ Registered new account: %s (ID: %s)",
+                    account.username, account.id)
 
         # Set HttpOnly session cookie so frontend can silently refresh on boot
         # Note: cookie is HttpOnly and cannot be read by JS; frontend will call /api/auth/refresh
@@ -274,8 +566,7 @@ async def register(
         raise
     except Exception as e:
         await db_session.rollback()
-        import traceback
-        traceback.print_exc()
+        logger.exception("Account registration failed")
         raise HTTPException(
             status_code=500, detail=f"Error creating account: {str(e)}")
 
@@ -300,28 +591,39 @@ async def login(
     try:
         # Find account
         result = await db_session.execute(
-            select(Account).where(Account.username == request.username.lower())
+            select(Account)
+            .where(Account.username == request.username.lower())
+            .limit(1)
         )
-        account = result.scalar_one_or_none()
+        account = result.scalars().first()
 
         if not account:
             raise HTTPException(
                 status_code=401, detail="Invalid username or password")
 
-        # Verify password
-        if not verify_password(request.password, account.password_hash):
+        # Verify password - bcrypt is CPU-bound, keep it off the event loop
+        password_ok = await asyncio.to_thread(
+            verify_password, request.password, account.password_hash)
+        if not password_ok:
             raise HTTPException(
                 status_code=401, detail="Invalid username or password")
 
-        # Update last login
-        account.last_login = datetime.utcnow()
+        # Update last login with a single-column UPDATE that skips the
+        # ORM's dirty tracking of the account
+        await db_session.execute(
+            update(Account)
+            .where(Account.id == account.id)
+            .values(last_login=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
 
-        # Create session token
-        token = await create_session_token(account.id, db_session)
+        # Reuse the active session token if there is one
+        token = await get_or_create_session_token(account.id, db_session)
 
         await db_session.commit()
 
-        print(f"✅ User logged in: {account.username} (ID: {account.id})")
+        logger.info("✅ User logged in: %s (ID: %s)",
+                    account.username, account.id)
 
         # Set HttpOnly session cookie for refresh flow
         response.set_cookie(
@@ -345,8 +647,7 @@ async def login(
         raise
     except Exception as e:
         await db_session.rollback()
-        import traceback
-        traceback.print_exc()
+        logger.exception("Login failed")
         raise HTTPException(
             status_code=500, detail=f"Error during login: {str(e)}")
 
@@ -367,19 +668,18 @@ async def logout(
     """
     try:
         # Parse token
-        parts = authorization.split()
-        if len(parts) != 2 or parts[0].lower() != "bearer":
+        token = extract_bearer_token(authorization)
+        if not token:
             raise HTTPException(
                 status_code=401, detail="Invalid authorization header")
 
-        token = parts[1]
-
         # Find and deactivate token
         result = await db_session.execute(
-            select(SessionToken).where(SessionToken.token == token)
+            select(SessionToken).where(SessionToken.token == token).limit(1)
         )
-        session_token = result.scalar_one_or_none()
+        session_token = result.scalars().first()
 
+        forget_validated_token(token)
         if session_token:
             session_token.is_active = False
             await db_session.commit()
@@ -437,8 +737,7 @@ async def refresh_auth(
 
 @app.get("/api/account/profile", response_model=AccountProfileResponse, tags=["Account"])
 async def get_account_profile(
-    authorization: str = Header(...),
-    db_session: AsyncSession = Depends(get_session)
+    account: Account = Depends(get_current_account)
 ):
     """
     Get current account profile and onboarding defaults
@@ -450,39 +749,14 @@ async def get_account_profile(
 
     **Returns:** Account profile with onboarding defaults
     """
-    # Parse and validate token
-    parts = authorization.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        raise HTTPException(
-            status_code=401, detail="Invalid authorization header")
-
-    token = parts[1]
-    account = await validate_token(token, db_session)
-    if not account:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
-
-    return AccountProfileResponse(
-        account_id=account.id,
-        username=account.username,
-        display_name=account.display_name,
-        created_at=account.created_at,
-        has_completed_onboarding=account.has_completed_onboarding,
-        default_age=account.default_age,
-        default_city=account.default_city,
-        default_education_path=account.default_education_path,
-        default_risk_attitude=account.default_risk_attitude,
-        default_monthly_income=account.default_monthly_income,
-        default_monthly_expenses=account.default_monthly_expenses,
-        default_starting_savings=account.default_starting_savings,
-        default_starting_debt=account.default_starting_debt,
-        default_aspirations=account.default_aspirations
-    )
+    return AccountProfileResponse.model_validate(
+        account, update={"account_id": account.id})
 
 
 @app.put("/api/account/onboarding", tags=["Account"])
 async def update_onboarding_defaults(
     request: UpdateOnboardingDefaultsRequest,
-    authorization: str = Header(...),
+    account_id: int = Depends(get_current_account_id),
     db_session: AsyncSession = Depends(get_session)
 ):
     """
@@ -498,31 +772,28 @@ async def update_onboarding_defaults(
     **Returns:** Success message
     """
     try:
-        # Parse and validate token
-        parts = authorization.split()
-        if len(parts) != 2 or parts[0].lower() != "bearer":
-            raise HTTPException(
-                status_code=401, detail="Invalid authorization header")
-
-        token = parts[1]
-        account = await validate_token(token, db_session)
-        if not account:
-            raise HTTPException(
-                status_code=401, detail="Invalid or expired token")
-        account.default_age = request.age
-        account.default_city = request.city
-        account.default_education_path = request.education_path
-        account.default_risk_attitude = request.risk_attitude
-        account.default_monthly_income = request.monthly_income
-        account.default_monthly_expenses = request.monthly_expenses
-        account.default_starting_savings = request.starting_savings
-        account.default_starting_debt = request.starting_debt
-        account.default_aspirations = request.aspirations
-        account.has_completed_onboarding = True
-
+        # One UPDATE on the wire - the account row is never loaded
+        await db_session.execute(
+            update(Account)
+            .where(Account.id == account_id)
+            .values(
+                default_age=request.age,
+                default_city=request.city,
+                default_education_path=request.education_path,
+                default_risk_attitude=request.risk_attitude,
+                default_monthly_income=request.monthly_income,
+                default_monthly_expenses=request.monthly_expenses,
+                default_starting_savings=request.starting_savings,
+                default_starting_debt=request.starting_debt,
+                default_aspirations=request.aspirations,
+                has_completed_onboarding=True
+            )
+            .execution_options(synchronize_session=False)
+        )
         await db_session.commit()
 
-        print(f"✅ Updated onboarding defaults for account: {account.username}")
+        logger.info("✅ Updated onboarding defaults for account ID: %s",
+                    account_id)
 
         return {"message": "Onboarding defaults updated successfully"}
 
@@ -532,8 +803,63 @@ async def update_onboarding_defaults(
             status_code=500, detail=f"Error updating defaults: {str(e)}")
 
 
+async def summarize_chat_session(
+    chat_session_id: int,
+    summary_start: int,
+    summary_end: int,
+    game_state: GameState,
+    profile: PlayerProfile
+):
+    """
+    Background task to summarize the latest chat messages.
+    Runs after the chat response has been sent, in its own database session.
+    """
+    try:
+        logger.debug("📊 Creating summary for chat session (message count: %d)",
+                     summary_end)
+
+        async with async_session_maker() as summary_session:
+            chat_session = await summary_session.get(ChatSession, chat_session_id)
+            if chat_session is None:
+                logger.warning("⚠️ Chat session %d not found for summary",
+                               chat_session_id)
+                return
+
+            # Get messages for summary (last 10)
+            messages_for_summary = await get_recent_chat_messages(
+                chat_session_id=chat_session_id,
+                db_session=summary_session,
+                limit=10
+            )
+
+            summary_text = await create_chat_summary(
+                messages=messages_for_summary,
+                game_state=game_state,
+                profile=profile,
+                client=client
+            )
+
+            await store_chat_summary(
+                chat_session=chat_session,
+                summary_text=summary_text,
+                message_range_start=summary_start,
+                message_range_end=summary_end,
+                db_session=summary_session
+            )
+            await summary_session.commit()
+
+        logger.debug("✅ Summary created: %.100s...", summary_text)
+
+    except Exception as e:
+        logger.warning("⚠️ Failed to create summary: %s", e)
+
+
 @app.post("/api/chat", response_model=ChatResponse, tags=["Chat"])
-async def chat(request: ChatRequest, db_session: AsyncSession = Depends(get_session)):
+async def chat(
+    request: ChatRequest,
+    background_tasks: BackgroundTasks,
+    db_session: AsyncSession = Depends(get_session)
+):
     """
     Send a chat message and receive game-aware AI response
 
@@ -545,9 +871,9 @@ async def chat(request: ChatRequest, db_session: AsyncSession = Depends(get_sess
 
     **Process:**
     1. Retrieves or creates chat session for your game
-    2. Saves your message to chat history
-    3. Generates context-aware AI response
-    4. Automatically creates summary every 10 messages
+    2. Generates context-aware AI response
+    3. Saves your message and the response to chat history
+    4. Schedules a history summary every 10 messages (after responding)
     5. Returns AI response
 
     **Parameters:**
@@ -558,23 +884,13 @@ async def chat(request: ChatRequest, db_session: AsyncSession = Depends(get_sess
     **Returns:** AI response with session and message tracking info
     """
     try:
-        # Get player profile and game state
-        result = await db_session.execute(
-            select(PlayerProfile).where(
-                PlayerProfile.session_id == request.session_id)
-        )
-        profile = result.scalar_one_or_none()
+        # Chat only reads the profile and state - take the snapshot if warm
+        profile, game_state = (
+            peek_session_state(request.session_id)
+            or await load_session(db_session, request.session_id))
 
-        if not profile:
-            raise HTTPException(status_code=404, detail="Session not found")
-
-        result = await db_session.execute(
-            select(GameState).where(GameState.profile_id == profile.id)
-        )
-        game_state = result.scalar_one_or_none()
-
-        if not game_state:
-            raise HTTPException(status_code=404, detail="Game state not found")
+        # Unknown model ids fall back to the default instead of failing
+        model_to_use = request.model if request.model in VALID_GEMINI_MODELS else DEFAULT_CHAT_MODEL
 
         # Get or create chat session
         chat_session = await get_or_create_chat_session(
@@ -583,14 +899,9 @@ async def chat(request: ChatRequest, db_session: AsyncSession = Depends(get_sess
             db_session=db_session
         )
 
-        # Save user message
-        user_message = await save_chat_message(
-            chat_session=chat_session,
-            role=ChatRole.USER,
-            content=request.message,
-            db_session=db_session,
-            message_metadata={"model": request.model}
-        )
+        # The user message is saved together with the reply below; the
+        # prompt carries it directly, so the history context doesn't need it
+        asked_at = datetime.utcnow()
 
         # Generate AI response
         ai_response_text = await generate_chat_response(
@@ -599,72 +910,52 @@ async def chat(request: ChatRequest, db_session: AsyncSession = Depends(get_sess
             game_state=game_state,
             profile=profile,
             db_session=db_session,
-            client=client
+            client=client,
+            model=model_to_use
         )
 
-        # Save AI response
-        ai_message = await save_chat_message(
+        # Save the user message and AI response in one batched insert
+        user_message, ai_message = await save_chat_exchange(
             chat_session=chat_session,
-            role=ChatRole.ASSISTANT,
-            content=ai_response_text,
+            user_content=request.message,
+            assistant_content=ai_response_text,
             db_session=db_session,
-            message_metadata={"model": request.model}
+            asked_at=asked_at,
+            message_metadata={"model": model_to_use}
         )
 
-        # Check if we should create a summary
+        # Summaries take another LLM call - run them after the response is
+        # sent. The window is claimed here so a quick follow-up message
+        # doesn't summarize it again while the task is still running.
         if await should_create_summary(chat_session):
-            print(
-                f"📊 Creating summary for chat session (message count: {chat_session.message_count})")
-            try:
-                # Get messages for summary (last 10)
-                summary_start = max(1, chat_session.message_count - 9)
-                summary_end = chat_session.message_count
-
-                messages_for_summary = await get_recent_chat_messages(
-                    chat_session_id=chat_session.id,
-                    db_session=db_session,
-                    limit=10
-                )
-
-                summary_text = await create_chat_summary(
-                    messages=messages_for_summary,
-                    game_state=game_state,
-                    profile=profile,
-                    client=client
-                )
-
-                await store_chat_summary(
-                    chat_session=chat_session,
-                    summary_text=summary_text,
-                    message_range_start=summary_start,
-                    message_range_end=summary_end,
-                    db_session=db_session
-                )
-
-                print(f"✅ Summary created: {summary_text[:100]}...")
-
-            except Exception as e:
-                print(f"⚠️ Failed to create summary: {e}")
+            summary_start = max(1, chat_session.message_count - 9)
+            summary_end = chat_session.message_count
+            chat_session.last_summary_at = summary_end
+            background_tasks.add_task(
+                summarize_chat_session,
+                chat_session.id,
+                summary_start,
+                summary_end,
+                game_state,
+                profile
+            )
 
-        # Commit all changes
+        # Commit all changes - ids and defaults are already on the objects
         await db_session.commit()
-        await db_session.refresh(ai_message)
 
         return ChatResponse(
             response=ai_response_text,
             session_id=request.session_id,
             chat_session_id=chat_session.chat_session_id,
             message_id=ai_message.id,
-            model=request.model
+            model=model_to_use
         )
 
     except HTTPException:
         raise
     except Exception as e:
         await db_session.rollback()
-        print(f"❌ Chat error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Chat request failed")
         raise HTTPException(
             status_code=500, detail=f"Error processing chat: {str(e)}")
 
@@ -676,15 +967,7 @@ async def list_models():
 
     Get a list of all available Gemini models that can be used for chat.
     """
-    return {
-        "models": [
-            {"id": "gemini-2.0-flash-exp",
-                "name": "Gemini 2.0 Flash (Experimental)"},
-            {"id": "gemini-1.5-pro", "name": "Gemini 1.5 Pro"},
-            {"id": "gemini-1.5-flash", "name": "Gemini 1.5 Flash"},
-            {"id": "gemini-pro", "name": "Gemini Pro"},
-        ]
-    }
+    return Response(content=_MODELS_JSON, media_type="application/json")
 
 
 @app.get("/api/chat/history/{session_id}", response_model=ChatHistoryResponse, tags=["Chat"])
@@ -692,6 +975,7 @@ async def get_chat_history(
     session_id: str,
     page: int = 1,
     page_size: int = 20,
+    before_id: Optional[int] = None,
     db_session: AsyncSession = Depends(get_session)
 ):
     """
@@ -708,6 +992,8 @@ async def get_chat_history(
     - **session_id**: Game session ID
     - **page**: Page number (default: 1)
     - **page_size**: Messages per page (default: 20, max: 100)
+    - **before_id**: Keyset cursor - return the messages older than this
+      message ID (the first message of the previous page) instead of `page`
 
     **Returns:** Chat messages, summary (if available), and pagination info
     """
@@ -719,22 +1005,18 @@ async def get_chat_history(
             raise HTTPException(
                 status_code=400, detail="Page size must be between 1 and 100")
 
-        # Get player profile
+        # Get chat session straight from the game session ID
         result = await db_session.execute(
-            select(PlayerProfile).where(PlayerProfile.session_id == session_id)
+            CHAT_SESSION_BY_SESSION_ID, {"session_id": session_id}
         )
-        profile = result.scalar_one_or_none()
-
-        if not profile:
-            raise HTTPException(status_code=404, detail="Session not found")
-
-        # Get chat session
-        result = await db_session.execute(
-            select(ChatSession).where(ChatSession.profile_id == profile.id)
-        )
-        chat_session = result.scalar_one_or_none()
+        chat_session = result.scalars().first()
 
         if not chat_session:
+            # Either no chat yet or no such game session
+            if await resolve_profile_id(session_id, db_session) is None:
+                raise HTTPException(
+                    status_code=404, detail="Session not found")
+
             # No chat history yet
             return ChatHistoryResponse(
                 session_id=session_id,
@@ -747,32 +1029,48 @@ async def get_chat_history(
                 has_more=False
             )
 
-        # Get total message count
-        from sqlmodel import func
-        count_result = await db_session.execute(
-            select(func.count(ChatMessage.id))
-            .where(ChatMessage.chat_session_id == chat_session.id)
-        )
-        total_count = count_result.scalar()
-
-        # Calculate pagination
-        offset = (page - 1) * page_size
-        has_more = (offset + page_size) < total_count
-
-        # Get messages for current page
-        result = await db_session.execute(
-            select(ChatMessage)
-            .where(ChatMessage.chat_session_id == chat_session.id)
-            .order_by(ChatMessage.created_at.desc())
-            .limit(page_size)
-            .offset(offset)
-        )
-        messages = result.scalars().all()
+        # save_chat_exchange keeps the counter in step with the inserts
+        total_count = chat_session.message_count
+        newest_first = (ChatMessage.created_at.desc(), ChatMessage.id.desc())
+
+        if before_id is not None:
+            # Keyset page: range scan from the cursor message, one extra row
+            # tells whether older messages remain
+            cursor_created_at = (
+                select(ChatMessage.created_at)
+                .where(ChatMessage.id == before_id)
+                .scalar_subquery()
+            )
+            result = await db_session.execute(
+                select(ChatMessage)
+                .where(
+                    ChatMessage.chat_session_id == chat_session.id,
+                    tuple_(ChatMessage.created_at, ChatMessage.id)
+                    < tuple_(cursor_created_at, before_id)
+                )
+                .order_by(*newest_first)
+                .limit(page_size + 1)
+            )
+            messages = result.scalars().all()
+            has_more = len(messages) > page_size
+            messages = messages[:page_size]
+        else:
+            # Get messages for current page
+            offset = (page - 1) * page_size
+            result = await db_session.execute(
+                select(ChatMessage)
+                .where(ChatMessage.chat_session_id == chat_session.id)
+                .order_by(*newest_first)
+                .limit(page_size)
+                .offset(offset)
+            )
+            messages = result.scalars().all()
 
-        # Reverse to get chronological order
-        messages = list(reversed(messages))
+            # Calculate pagination
+            has_more = (offset + page_size) < total_count
 
-        # Format messages
+        # Format messages, walking the newest-first page backwards to get
+        # chronological order without copying the list
         message_responses = [
             ChatMessageResponse(
                 id=msg.id,
@@ -780,7 +1078,7 @@ async def get_chat_history(
                 content=msg.content,
                 created_at=msg.created_at
             )
-            for msg in messages
+            for msg in reversed(messages)
         ]
 
         # Get summary if available
@@ -807,9 +1105,7 @@ async def get_chat_history(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Failed to retrieve chat history: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Failed to retrieve chat history")
         raise HTTPException(
             status_code=500, detail=f"Error retrieving chat history: {str(e)}")
 
@@ -851,21 +1147,20 @@ async def create_player(
 
         if authorization:
             # Try to get account - parse token
-            parts = authorization.split()
-            if len(parts) == 2 and parts[0].lower() == "bearer":
-                token = parts[1]
+            token = extract_bearer_token(authorization)
+            if token:
                 account = await validate_token(token, session)
             else:
                 account = None
 
             if account:
                 is_test_mode = False  # Authenticated = not test mode
-                print(
-                    f"🔐 Authenticated user starting game: {account.username}")
+                logger.info(
+                    "🔐 Authenticated user starting game: %s", account.username)
             else:
-                print(f"👤 Guest user starting game (test mode)")
+                logger.info("👤 Guest user starting game (test mode)")
         else:
-            print(f"👤 Guest user starting game (test mode)")
+            logger.info("👤 Guest user starting game (test mode)")
 
         # Generate unique session ID
         session_id = generate_session_id()
@@ -885,9 +1180,6 @@ async def create_player(
             aspirations=request.aspirations
         )
 
-        session.add(profile)
-        await session.flush()  # Get the profile ID
-
         # If authenticated and first onboarding, save as defaults
         if account and not account.has_completed_onboarding:
             account.default_age = request.age
@@ -905,8 +1197,8 @@ async def create_player(
             account.default_starting_debt = request.starting_debt
             account.default_aspirations = request.aspirations
             account.has_completed_onboarding = True
-            print(
-                f"✅ Saved onboarding defaults for account: {account.username}")
+            logger.info(
+                "✅ Saved onboarding defaults for account: %s", account.username)
 
         # Initialize game state with individual expense categories
         initial_state = initialize_game_state(
@@ -921,10 +1213,7 @@ async def create_player(
             request.expense_other,
             request.active_subscriptions
         )
-        game_state = GameState(
-            profile_id=profile.id,
-            **initial_state
-        )
+        game_state = GameState(**initial_state)
 
         # Calculate initial FI score
         game_state.fi_score = calculate_fi_score(
@@ -932,58 +1221,37 @@ async def create_player(
             game_state.monthly_expenses
         )
 
-        session.add(game_state)
-        await session.commit()
-        await session.refresh(game_state)
-
-        # Generate initial event and options
+        # Generate initial event and options. Narrative and dynamic options
+        # come from a single AI call that only reads the in-memory profile and
+        # state, so it runs while the rows are being inserted.
         initial_event_type = get_event_type(game_state, profile)
-
-        initial_narrative = await generate_event_narrative(
+        bundle_task = asyncio.create_task(generate_event_bundle(
             event_type=initial_event_type,
             state=game_state,
             profile=profile,
-            db_session=None,
             curveball=None,
             client=client
-        )
+        ))
+
+        # The relationship cascades the game state, so both rows are inserted
+        # in dependency order within one flush
+        try:
+            profile.game_state = game_state
+            session.add(profile)
+            await session.commit()
+        except BaseException:
+            bundle_task.cancel()
+            raise
+
+        initial_narrative, initial_options_data = await bundle_task
+
+        # Keep the served options so /api/step can read them back
+        game_state.presented_options = initial_options_data
+        await session.commit()
+        remember_session_state(profile.session_id, profile, game_state)
+        profile_id_cache.set(profile.session_id, profile.id)
 
-        # Generate dynamic options with AI - frontend will send these back with effects
-        initial_options_data = generate_dynamic_options(
-            event_type=initial_event_type,
-            narrative=initial_narrative,
-            state=game_state,
-            profile=profile,
-            client=client
-        )
-
-        game_state_response = GameStateResponse(
-            session_id=session_id,
-            current_step=game_state.current_step,
-            current_age=game_state.current_age,
-            years_passed=game_state.years_passed,
-            money=game_state.money,
-            monthly_income=game_state.monthly_income,
-            monthly_expenses=game_state.monthly_expenses,
-            expense_housing=game_state.expense_housing,
-            expense_food=game_state.expense_food,
-            expense_transport=game_state.expense_transport,
-            expense_utilities=game_state.expense_utilities,
-            expense_subscriptions=game_state.expense_subscriptions,
-            expense_insurance=game_state.expense_insurance,
-            expense_other=game_state.expense_other,
-            active_subscriptions=game_state.active_subscriptions,
-            investments=game_state.investments,
-            passive_income=game_state.passive_income,
-            debts=game_state.debts,
-            fi_score=game_state.fi_score,
-            energy=game_state.energy,
-            motivation=game_state.motivation,
-            social_life=game_state.social_life,
-            financial_knowledge=game_state.financial_knowledge,
-            assets=game_state.assets,
-            game_status=game_state.game_status
-        )
+        game_state_response = build_state_response(game_state, session_id)
 
         return OnboardingResponse(
             game_state=game_state_response,
@@ -993,8 +1261,7 @@ async def create_player(
 
     except Exception as e:
         await session.rollback()
-        import traceback
-        traceback.print_exc()
+        logger.exception("Onboarding failed")
         raise HTTPException(
             status_code=500, detail=f"Error creating player: {str(e)}")
 
@@ -1015,52 +1282,18 @@ async def get_game_state(
 
     **Returns:** Current game state with all financial metrics
     """
-    try:
-        # Find the profile
-        result = await session.execute(
-            select(PlayerProfile).where(PlayerProfile.session_id == session_id)
-        )
-        profile = result.scalar_one_or_none()
-
-        if not profile:
-            raise HTTPException(status_code=404, detail="Session not found")
+    cached = game_state_cache.get(session_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-        # Get game state
-        result = await session.execute(
-            select(GameState).where(GameState.profile_id == profile.id)
-        )
-        game_state = result.scalar_one_or_none()
+    try:
+        # Find the profile and its game state - snapshot first, then one
+        # joined round-trip
+        profile, game_state = (
+            peek_session_state(session_id)
+            or await load_session(session, session_id))
 
-        if not game_state:
-            raise HTTPException(status_code=404, detail="Game state not found")
-
-        return GameStateResponse(
-            session_id=session_id,
-            current_step=game_state.current_step,
-            current_age=game_state.current_age,
-            years_passed=game_state.years_passed,
-            money=game_state.money,
-            monthly_income=game_state.monthly_income,
-            monthly_expenses=game_state.monthly_expenses,
-            expense_housing=game_state.expense_housing,
-            expense_food=game_state.expense_food,
-            expense_transport=game_state.expense_transport,
-            expense_utilities=game_state.expense_utilities,
-            expense_subscriptions=game_state.expense_subscriptions,
-            expense_insurance=game_state.expense_insurance,
-            expense_other=game_state.expense_other,
-            active_subscriptions=game_state.active_subscriptions,
-            investments=game_state.investments,
-            passive_income=game_state.passive_income,
-            debts=game_state.debts,
-            fi_score=game_state.fi_score,
-            energy=game_state.energy,
-            motivation=game_state.motivation,
-            social_life=game_state.social_life,
-            financial_knowledge=game_state.financial_knowledge,
-            assets=game_state.assets,
-            game_status=game_state.game_status
-        )
+        return build_state_response(game_state, session_id)
 
     except HTTPException:
         raise
@@ -1089,23 +1322,7 @@ async def update_expenses(
     **Returns:** Updated game state with expense savings and stat changes
     """
     try:
-        # Find the profile
-        result = await db_session.execute(
-            select(PlayerProfile).where(PlayerProfile.session_id == session_id)
-        )
-        profile = result.scalar_one_or_none()
-
-        if not profile:
-            raise HTTPException(status_code=404, detail="Session not found")
-
-        # Get game state
-        result = await db_session.execute(
-            select(GameState).where(GameState.profile_id == profile.id)
-        )
-        game_state = result.scalar_one_or_none()
-
-        if not game_state:
-            raise HTTPException(status_code=404, detail="Game state not found")
+        profile, game_state = await load_session(db_session, session_id)
 
         # Define optional expense amounts (these match frontend ExpensesBreakdown.js)
         # Note: stat values show per-step benefits (applied every turn you have the subscription)
@@ -1179,36 +1396,10 @@ async def update_expenses(
 
         # Commit changes to database
         await db_session.commit()
-        await db_session.refresh(game_state)
+        remember_session_state(session_id, profile, game_state)
 
         # Return updated game state
-        updated_game_state = GameStateResponse(
-            session_id=session_id,
-            current_step=game_state.current_step,
-            current_age=game_state.current_age,
-            years_passed=game_state.years_passed,
-            money=game_state.money,
-            monthly_income=game_state.monthly_income,
-            monthly_expenses=game_state.monthly_expenses,
-            expense_housing=game_state.expense_housing,
-            expense_food=game_state.expense_food,
-            expense_transport=game_state.expense_transport,
-            expense_utilities=game_state.expense_utilities,
-            expense_subscriptions=game_state.expense_subscriptions,
-            expense_insurance=game_state.expense_insurance,
-            expense_other=game_state.expense_other,
-            active_subscriptions=game_state.active_subscriptions,
-            investments=game_state.investments,
-            passive_income=game_state.passive_income,
-            debts=game_state.debts,
-            fi_score=game_state.fi_score,
-            energy=game_state.energy,
-            motivation=game_state.motivation,
-            social_life=game_state.social_life,
-            financial_knowledge=game_state.financial_knowledge,
-            assets=game_state.assets,
-            game_status=game_state.game_status
-        )
+        updated_game_state = build_state_response(game_state, session_id)
 
         return UpdateExpensesResponse(
             game_state=updated_game_state,
@@ -1224,6 +1415,28 @@ async def update_expenses(
             status_code=500, detail=f"Error updating expenses: {str(e)}")
 
 
+# Columns returned by /api/transactions, in response order
+TRANSACTION_LOG_COLUMNS = (
+    TransactionLog.step_number,
+    TransactionLog.event_type,
+    TransactionLog.chosen_option,
+    TransactionLog.cash_change,
+    TransactionLog.investment_change,
+    TransactionLog.debt_change,
+    TransactionLog.monthly_income_change,
+    TransactionLog.monthly_expense_change,
+    TransactionLog.passive_income_change,
+    TransactionLog.cash_balance,
+    TransactionLog.investment_balance,
+    TransactionLog.debt_balance,
+    TransactionLog.monthly_income_total,
+    TransactionLog.monthly_expense_total,
+    TransactionLog.passive_income_total,
+    TransactionLog.description,
+    TransactionLog.created_at,
+)
+
+
 @app.get("/api/transactions/{session_id}", response_model=List[dict], tags=["Game"])
 async def get_transaction_logs(
     session_id: str,
@@ -1242,44 +1455,23 @@ async def get_transaction_logs(
     """
     try:
         # Find the profile
-        result = await session.execute(
-            select(PlayerProfile).where(PlayerProfile.session_id == session_id)
-        )
-        profile = result.scalar_one_or_none()
+        profile_id = await resolve_profile_id(session_id, session)
 
-        if not profile:
+        if profile_id is None:
             raise HTTPException(status_code=404, detail="Session not found")
 
-        # Get all transaction logs
+        # Get all transaction logs - only the returned columns, so rows map
+        # straight onto the response entries
         result = await session.execute(
-            select(TransactionLog)
-            .where(TransactionLog.profile_id == profile.id)
+            select(*TRANSACTION_LOG_COLUMNS)
+            .where(TransactionLog.profile_id == profile_id)
             .order_by(TransactionLog.step_number)
         )
-        transactions = result.scalars().all()
-
-        return [
-            {
-                "step_number": t.step_number,
-                "event_type": t.event_type,
-                "chosen_option": t.chosen_option,
-                "cash_change": t.cash_change,
-                "investment_change": t.investment_change,
-                "debt_change": t.debt_change,
-                "monthly_income_change": t.monthly_income_change,
-                "monthly_expense_change": t.monthly_expense_change,
-                "passive_income_change": t.passive_income_change,
-                "cash_balance": t.cash_balance,
-                "investment_balance": t.investment_balance,
-                "debt_balance": t.debt_balance,
-                "monthly_income_total": t.monthly_income_total,
-                "monthly_expense_total": t.monthly_expense_total,
-                "passive_income_total": t.passive_income_total,
-                "description": t.description,
-                "created_at": t.created_at.isoformat()
-            }
-            for t in transactions
-        ]
+
+        # orjson writes the datetimes itself and skips response_model
+        # re-validation of the plain dicts
+        return ORJSONResponse(
+            content=[dict(row) for row in result.mappings()])
 
     except HTTPException:
         raise
@@ -1290,8 +1482,9 @@ async def get_transaction_logs(
 
 @app.get("/api/leaderboard", response_model=List[dict], tags=["Leaderboard"])
 async def get_leaderboard(
-    limit: int = 10,
+    limit: int = Query(10, ge=1, le=LEADERBOARD_TOP_N),
     include_test_mode: bool = False,
+    if_none_match: Optional[str] = Header(None),
     session: AsyncSession = Depends(get_session)
 ):
     """
@@ -1301,38 +1494,55 @@ async def get_leaderboard(
     By default, excludes test mode (guest) plays.
 
     **Parameters:**
-    - **limit**: Maximum number of players to return (default: 10)
+    - **limit**: Maximum number of players to return (1-100, default: 10)
     - **include_test_mode**: Include test mode plays (default: false)
 
     **Returns:** List of top players with their scores and achievements
+    (with an ETag; a matching If-None-Match gets 304 Not Modified)
     """
+    cache_key = (limit, include_test_mode)
+    cached = leaderboard_cache.get(cache_key)
+    if cached is not None:
+        etag, content = cached
+        return leaderboard_response(content, etag, if_none_match)
+
     try:
-        # Build query
-        query = select(LeaderboardEntry).order_by(
-            LeaderboardEntry.final_fi_score.desc())
+        top = leaderboard_top_cache.get(include_test_mode)
+        if top is not None:
+            content = orjson.dumps(top[:limit])
+            etag = cache_leaderboard(cache_key, content)
+            return leaderboard_response(content, etag, if_none_match)
+
+        # Build query - select only the needed columns, with the rank computed
+        # by the database, so rows map straight onto the response entries
+        query = select(
+            func.row_number().over(
+                order_by=LeaderboardEntry.final_fi_score.desc()).label("rank"),
+            LeaderboardEntry.player_name,
+            LeaderboardEntry.final_fi_score,
+            LeaderboardEntry.balance_score,
+            LeaderboardEntry.age,
+            LeaderboardEntry.education_path,
+            LeaderboardEntry.completed_at,
+            LeaderboardEntry.is_test_mode
+        ).order_by(LeaderboardEntry.final_fi_score.desc())
 
         # Filter out test mode by default
         if not include_test_mode:
             query = query.where(LeaderboardEntry.is_test_mode == False)
 
-        query = query.limit(limit)
+        # Fetch the top N so other limits are served from the slice
+        query = query.limit(LEADERBOARD_TOP_N)
 
         result = await session.execute(query)
-        entries = result.scalars().all()
-
-        return [
-            {
-                "rank": idx + 1,
-                "player_name": entry.player_name,
-                "final_fi_score": entry.final_fi_score,
-                "balance_score": entry.balance_score,
-                "age": entry.age,
-                "education_path": entry.education_path,
-                "completed_at": entry.completed_at.isoformat(),
-                "is_test_mode": entry.is_test_mode
-            }
-            for idx, entry in enumerate(entries)
-        ]
+        # orjson writes the datetimes and enums itself
+        entries = [dict(row) for row in result.mappings()]
+
+        leaderboard_top_cache.set(include_test_mode, entries)
+
+        content = orjson.dumps(entries[:limit])
+        etag = cache_leaderboard(cache_key, content)
+        return leaderboard_response(content, etag, if_none_match)
 
     except Exception as e:
         raise HTTPException(
@@ -1358,40 +1568,10 @@ async def get_decision_history(
     **Returns:** Decision history with states, or summary + recent decisions
     """
     try:
-        # Get player profile
-        result = await db_session.execute(
-            select(PlayerProfile).where(PlayerProfile.session_id == session_id)
-        )
-        profile = result.scalar_one_or_none()
-
-        if not profile:
-            raise HTTPException(status_code=404, detail="Session not found")
-
-        # Get game state for current info
-        result = await db_session.execute(
-            select(GameState).where(GameState.profile_id == profile.id)
-        )
-        game_state = result.scalar_one_or_none()
-
-        if not game_state:
-            raise HTTPException(status_code=404, detail="Game state not found")
-
-        # Get total count of decisions
-        from sqlmodel import func
-        count_result = await db_session.execute(
-            select(func.count(DecisionHistory.id))
-            .where(DecisionHistory.profile_id == profile.id)
-        )
-        total_decisions = count_result.scalar()
-
-        # Get decision history
-        from utils import get_recent_decisions, create_decision_summary
-
-        decisions = await get_recent_decisions(
-            profile_id=profile.id,
-            db_session=db_session,
-            limit=limit
-        )
+        # Profile, game state, recent decisions and total count in one
+        # round-trip
+        profile, game_state, decisions, total_decisions = (
+            await load_session_with_decisions(db_session, session_id, limit))
 
         # Format decisions for response
         decision_list = []
@@ -1421,19 +1601,16 @@ async def get_decision_history(
 
         # Generate summary if needed
         summary = None
-        if total_decisions > 10:
-            # Get all decisions for summary
-            all_result = await db_session.execute(
-                select(DecisionHistory)
-                .where(DecisionHistory.profile_id == profile.id)
-                .order_by(DecisionHistory.step_number)
-            )
-            all_decisions = all_result.scalars().all()
+        if total_decisions > DECISION_SUMMARY_THRESHOLD:
+            # Aggregate all decisions in SQL instead of loading every row
+            stats = await load_decision_summary_stats(profile.id, db_session)
+            total_decisions = stats["total_decisions"]
 
             summary = await create_decision_summary(
-                decisions=list(all_decisions),
+                decisions=stats["first_decisions"],
                 current_age=game_state.current_age,
-                current_fi_score=game_state.fi_score
+                current_fi_score=game_state.fi_score,
+                stats=stats
             )
 
         return {
@@ -1451,17 +1628,19 @@ async def get_decision_history(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Failed to retrieve decision history: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Failed to retrieve decision history")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Strong references to fire-and-forget tasks - the event loop only keeps
+# weak ones, so an unreferenced task can be collected mid-flight
+next_question_tasks: Set[asyncio.Task] = set()
+
+
 async def generate_and_cache_next_question(
     game_state_id: int,
     game_state: GameState,
     profile: PlayerProfile,
-    db_session: AsyncSession,
     client: Optional[genai.Client]
 ):
     """
@@ -1469,11 +1648,7 @@ async def generate_and_cache_next_question(
     This runs asynchronously after the consequence is returned to the user.
     """
     try:
-        import json
-        from game_engine import get_event_type, generate_curveball_event, get_current_month_name
-        from ai_narrative import generate_event_narrative, generate_dynamic_options
-
-        print("\n🔄 Background: Starting next question generation...")
+        logger.debug("🔄 Background: Starting next question generation...")
 
         # Generate next event
         next_event_type = get_event_type(game_state, profile)
@@ -1481,18 +1656,103 @@ async def generate_and_cache_next_question(
         if next_event_type == "curveball":
             next_curveball = generate_curveball_event(game_state)
 
-        # Generate next narrative
-        next_narrative = await generate_event_narrative(
+        # Generate next narrative and dynamic options in one AI call
+        next_narrative, next_options_data = await generate_event_bundle(
             event_type=next_event_type,
             state=game_state,
             profile=profile,
-            db_session=None,  # Don't pass session to avoid state errors
             curveball=next_curveball,
             client=client
         )
 
-        # Generate dynamic next options with AI
-        next_options_data = generate_dynamic_options(
+        # Add event context to each option for frontend to send back
+        for opt in next_options_data:
+            opt['event_type'] = next_event_type
+            opt['narrative'] = next_narrative
+            opt['all_options'] = [o['text'] for o in next_options_data]
+
+        # Cache the results in the database
+        # We need a new session since we're in a background task
+        async with async_session_maker() as new_db_session:
+            # Fetch the game state again in this new session
+            cached_game_state = await new_db_session.get(
+                GameState, game_state_id)
+
+            if cached_game_state:
+                cached_game_state.cached_next_narrative = next_narrative
+                # orjson returns UTF-8 bytes; the column holds text
+                cached_game_state.cached_next_options = orjson.dumps(
+                    next_options_data).decode()
+                await new_db_session.commit()
+                logger.debug("✅ Background: Next question cached successfully")
+            else:
+                logger.warning("⚠️ Background: Game state not found for caching")
+
+    except Exception as e:
+        logger.exception("Background next question generation failed")
+
+
+async def pump_next_narrative(
+    queue: asyncio.Queue,
+    event_type: str,
+    game_state: GameState,
+    profile: PlayerProfile,
+    curveball: Optional[dict],
+    client: Optional[genai.Client]
+):
+    """
+    Feed next-narrative chunks from Gemini into a queue.
+    A trailing None marks the end of the narrative.
+    """
+    try:
+        async for chunk in stream_event_narrative(
+            event_type=event_type,
+            state=game_state,
+            profile=profile,
+            curveball=curveball,
+            client=client
+        ):
+            await queue.put(chunk)
+    finally:
+        # Unbounded queue: never suspends, even while being cancelled
+        queue.put_nowait(None)
+
+
+async def stream_decision_frames(
+    decision_response: DecisionResponse,
+    queue: asyncio.Queue,
+    narrative_task: asyncio.Task,
+    next_event_type: str,
+    game_state: GameState,
+    profile: PlayerProfile,
+    client: Optional[genai.Client]
+):
+    """
+    Yield NDJSON frames for a streamed /api/step response.
+
+    Frames:
+    - {"type": "decision", "data": {...}}: consequence and updated state
+    - {"type": "narrative", "text": "..."}: next narrative chunks as generated
+    - {"type": "next_options", "next_narrative": "...", "next_options": [...]}
+
+    If the client disconnects, the generator is closed at a yield (or
+    cancelled mid-await); narrative_task, which pumps Gemini chunks into the
+    queue, is then cancelled so nothing keeps streaming without a reader, and
+    the queue is simply dropped.
+    """
+    try:
+        yield orjson.dumps({
+            "type": "decision",
+            "data": decision_response.model_dump(mode="json")
+        }) + b"\n"
+
+        parts = []
+        while (chunk := await queue.get()) is not None:
+            parts.append(chunk)
+            yield orjson.dumps({"type": "narrative", "text": chunk}) + b"\n"
+        next_narrative = "".join(parts).strip()
+
+        next_options_data = await generate_dynamic_options(
             event_type=next_event_type,
             narrative=next_narrative,
             state=game_state,
@@ -1506,38 +1766,36 @@ async def generate_and_cache_next_question(
             opt['narrative'] = next_narrative
             opt['all_options'] = [o['text'] for o in next_options_data]
 
-        # Cache the results in the database
-        # We need a new session since we're in a background task
-        from database import async_engine
-        from sqlalchemy.ext.asyncio import async_sessionmaker
-        async_session = async_sessionmaker(
-            async_engine, expire_on_commit=False)
-
-        async with async_session() as new_db_session:
-            # Fetch the game state again in this new session
-            result = await new_db_session.execute(
-                select(GameState).where(GameState.id == game_state_id)
+        # Keep the served options so the next /api/step can read them back
+        async with async_session_maker() as options_session:
+            await options_session.execute(
+                update(GameState)
+                .where(GameState.id == game_state.id)
+                .values(presented_options=next_options_data)
             )
-            cached_game_state = result.scalar_one_or_none()
+            await options_session.commit()
+        game_state.presented_options = next_options_data
+        remember_session_state(profile.session_id, profile, game_state)
 
-            if cached_game_state:
-                cached_game_state.cached_next_narrative = next_narrative
-                cached_game_state.cached_next_options = json.dumps(
-                    next_options_data)
-                await new_db_session.commit()
-                print("✅ Background: Next question cached successfully")
-            else:
-                print("⚠️ Background: Game state not found for caching")
+        yield orjson.dumps({
+            "type": "next_options",
+            "next_narrative": next_narrative,
+            "next_options": next_options_data
+        }) + b"\n"
 
     except Exception as e:
-        print(f"❌ Background: Failed to generate next question: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Failed to stream next question")
+        yield orjson.dumps({"type": "error", "detail": str(e)}) + b"\n"
+    finally:
+        if not narrative_task.done():
+            logger.debug("Client left the step stream; cancelling next narrative")
+            narrative_task.cancel()
 
 
 @app.post("/api/step", response_model=DecisionResponse, tags=["Game"])
 async def process_decision(
     request: DecisionRequest,
+    stream: bool = False,
     db_session: AsyncSession = Depends(get_session)
 ):
     """
@@ -1557,46 +1815,37 @@ async def process_decision(
     - **session_id**: Current game session identifier
     - **chosen_option**: Text of chosen option
     - **option_index**: Index of the chosen decision option (0-based)
+    - **stream**: Stream NDJSON frames - the consequence first, then the next
+      narrative as Gemini generates it, then the next options
 
     **Returns:** Updated game state, consequence narrative, and next decision options
     """
     # === TIMING: Remove this line and all 'with timer()' blocks to disable ===
     start_total = time.time()
+    next_narrative_task = None
 
     try:
         # Get player profile and game state
         with timer("1. DB: Fetch profile and game state"):
-            result = await db_session.execute(
-                select(PlayerProfile).where(
-                    PlayerProfile.session_id == request.session_id)
-            )
-            profile = result.scalar_one_or_none()
-
-            if not profile:
-                raise HTTPException(
-                    status_code=404, detail="Session not found")
-
-            result = await db_session.execute(
-                select(GameState).where(GameState.profile_id == profile.id)
-            )
-            game_state = result.scalar_one_or_none()
-
-            if not game_state:
-                raise HTTPException(
-                    status_code=404, detail="Game state not found")
+            profile, game_state = await load_session(
+                db_session, request.session_id)
 
             if game_state.game_status != GameStatus.ACTIVE:
                 raise HTTPException(
                     status_code=400, detail="Game is not active")
 
-        # Apply monthly cash flow (only on phase 1 - start of month)
-        from game_engine import apply_monthly_cash_flow, get_month_phase_name, get_current_month_name
+        # End the read transaction so the pooled connection is released while
+        # the Gemini calls run. The objects stay loaded (expire_on_commit=False)
+        # and their changes are flushed in a fresh transaction at the final commit.
+        await db_session.commit()
 
+        # Apply monthly cash flow (only on phase 1 - start of month)
         with timer("2. Apply monthly cash flow"):
-            cash_flow_data = apply_monthly_cash_flow(game_state)
+            cash_flow_applied, cash_flow_data = apply_monthly_cash_flow(
+                game_state)
 
         # Log the monthly cash flow as a transaction (only if applied)
-        if cash_flow_data.get("applied", False):
+        if cash_flow_applied:
             monthly_flow_log = TransactionLog(
                 profile_id=profile.id,
                 step_number=game_state.current_step,
@@ -1618,19 +1867,34 @@ async def process_decision(
             )
             db_session.add(monthly_flow_log)
 
-        # Use the option data provided by the frontend
-        if not request.option_effects:
+        # Read the chosen option from the options stored when they were
+        # served - by index when it matches, else by text - and only fall
+        # back to the option data sent by the frontend
+        presented_options = game_state.presented_options or []
+        stored_option = None
+        if request.option_index is not None and 0 <= request.option_index < len(presented_options):
+            stored_option = presented_options[request.option_index]
+        if not stored_option or stored_option.get('text') != request.chosen_option:
+            options_by_text = {opt.get('text'): opt for opt in presented_options}
+            stored_option = options_by_text.get(request.chosen_option)
+
+        if stored_option:
+            chosen_option_data = dict(stored_option)
+            logger.debug("✅ Using stored option: %.80s", request.chosen_option)
+        elif request.option_effects:
+            chosen_option_data = request.option_effects
+            logger.debug("✅ Using frontend-provided option")
+        else:
             raise HTTPException(
                 status_code=400,
                 detail="option_effects is required. Frontend must send the full option data."
             )
 
-        chosen_option_data = request.option_effects
-        print(f"✅ Using frontend-provided option:")
-        print(f"  Text: {chosen_option_data.get('text', 'N/A')[:80]}")
-        print(
-            f"  Risk level: {chosen_option_data.get('risk_level', 'unknown')}")
-        print(f"  Category: {chosen_option_data.get('category', 'unknown')}")
+        logger.debug(
+            "  Text: %.80s | Risk level: %s | Category: %s",
+            chosen_option_data.get('text', 'N/A'),
+            chosen_option_data.get('risk_level', 'unknown'),
+            chosen_option_data.get('category', 'unknown'))
 
         # Extract event info from option data (for logging)
         current_event_type = chosen_option_data.get('event_type', 'unknown')
@@ -1638,20 +1902,20 @@ async def process_decision(
             'narrative', request.chosen_option)
 
         # Store state BEFORE any changes
-        state_before = {
-            'money': game_state.money,
-            'investments': game_state.investments,
-            'fi_score': game_state.fi_score,
-            'energy': game_state.energy,
-            'motivation': game_state.motivation,
-            'social': game_state.social_life,
-            'knowledge': game_state.financial_knowledge
-        }
+        state_before = StateBefore(
+            money=game_state.money,
+            investments=game_state.investments,
+            fi_score=game_state.fi_score,
+            energy=game_state.energy,
+            motivation=game_state.motivation,
+            social=game_state.social_life,
+            knowledge=game_state.financial_knowledge
+        )
         step_number = game_state.current_step
 
         # Generate consequence narrative AND effects (AI determines what happens)
-        print(
-            f"\n🎲 Generating consequence with AI (risk level: {chosen_option_data.get('risk_level', 'unknown')})...")
+        logger.debug("🎲 Generating consequence with AI (risk level: %s)",
+                     chosen_option_data.get('risk_level', 'unknown'))
         consequence_result = await generate_consequence_narrative(
             chosen_option=request.chosen_option,
             option_data=chosen_option_data,
@@ -1659,24 +1923,23 @@ async def process_decision(
             profile=profile,
             event_narrative=current_narrative,
             state_before=state_before,
-            db_session=db_session,
+            db_session=None,  # Keep the session idle during the LLM call
             client=client
         )
 
         consequence = consequence_result['narrative']
 
         # NEW: Use MCP financial calculator to determine actual effects
-        print(f"📜 Consequence: {consequence[:100]}...")
-        print(f"🔍 DEBUG - LLM Response structure:")
-        print(f"  Keys: {consequence_result.keys()}")
+        logger.debug("📜 Consequence: %.100s...", consequence)
+        logger.debug("🔍 LLM response keys: %s", list(consequence_result))
         if 'outcome' in consequence_result:
-            print(f"  Outcome: {consequence_result['outcome']}")
+            logger.debug("  Outcome: %s", consequence_result['outcome'])
         else:
-            print(f"  ⚠️  No 'outcome' key - LLM returned old format!")
-        print(f"🧮 Calculating effects via MCP financial server...")
+            logger.debug("  ⚠️  No 'outcome' key - LLM returned old format!")
+        logger.debug("🧮 Calculating effects via MCP financial server...")
 
         game_state_snapshot = {
-            "money": state_before['money'],
+            "money": state_before.money,
             "investments": game_state.investments
         }
 
@@ -1685,42 +1948,82 @@ async def process_decision(
             game_state_before=game_state_snapshot
         )
 
-        print(f"💰 Calculated effects:")
-        print(f"  Money: {effects_dict.get('money_change', 0)}")
-        print(f"  Investments: {effects_dict.get('investment_change', 0)}")
-        print(
-            f"  Passive Income: {effects_dict.get('passive_income_change', 0)}")
-        print(f"  Debt: {effects_dict.get('debt_change', 0)}")
+        logger.debug(
+            "💰 Calculated effects - Money: %s, Investments: %s, "
+            "Passive Income: %s, Debt: %s",
+            effects_dict.get('money_change', 0),
+            effects_dict.get('investment_change', 0),
+            effects_dict.get('passive_income_change', 0),
+            effects_dict.get('debt_change', 0))
 
         # NOW apply the effects that the MCP calculated
         effect = setup_dynamic_option_effect(effects_dict)
         transaction_data = apply_decision_effects(game_state, effect)
 
-        print(
-            f"  After effects - Money: {game_state.money}, Investments: {game_state.investments}")
+        logger.debug("  After effects - Money: %s, Investments: %s",
+                     game_state.money, game_state.investments)
 
         # Calculate life metrics changes
         life_metrics_changes = LifeMetricsChanges(
-            energy_change=game_state.energy - state_before['energy'],
+            energy_change=game_state.energy - state_before.energy,
             motivation_change=game_state.motivation -
-            state_before['motivation'],
-            social_change=game_state.social_life - state_before['social'],
+            state_before.motivation,
+            social_change=game_state.social_life - state_before.social,
             knowledge_change=game_state.financial_knowledge -
-            state_before['knowledge']
+            state_before.knowledge
         )
 
+        # The next question only depends on the post-decision state, so start
+        # generating it now - it overlaps the learning moment and the commit
+        if stream:
+            next_event_type = get_event_type(game_state, profile)
+            next_curveball = None
+            if next_event_type == "curveball":
+                next_curveball = generate_curveball_event(game_state)
+            next_narrative_queue = asyncio.Queue()
+            next_narrative_task = asyncio.create_task(
+                pump_next_narrative(
+                    next_narrative_queue,
+                    next_event_type,
+                    game_state,
+                    profile,
+                    next_curveball,
+                    client
+                )
+            )
+        else:
+            next_narrative_task = asyncio.create_task(
+                generate_and_cache_next_question(
+                    game_state.id,
+                    game_state,
+                    profile,
+                    client
+                )
+            )
+            # Keep the task alive after the handler returns
+            next_question_tasks.add(next_narrative_task)
+            next_narrative_task.add_done_callback(next_question_tasks.discard)
+
         # Generate learning moment (sometimes)
         with timer("8. AI: Generate learning moment"):
-            learning = generate_learning_moment(
+            learning = await generate_learning_moment(
                 chosen_option=request.chosen_option,
                 state=game_state,
                 profile=profile,
                 client=client
             )
 
-        # For options_presented, use what frontend sent (if available)
-        options_presented_texts = chosen_option_data.get(
-            'all_options', [request.chosen_option])
+        # For options_presented, keep the full option dicts stored when they
+        # were served (minus the per-option copies of the event context);
+        # fall back to the texts the frontend sent
+        if game_state.presented_options:
+            options_presented = [
+                {k: v for k, v in opt.items() if k not in ('narrative', 'all_options')}
+                for opt in game_state.presented_options]
+        else:
+            options_presented = [
+                {"text": text} for text in
+                chosen_option_data.get('all_options', [request.chosen_option])]
 
         # Record decision in history
         decision_record = DecisionHistory(
@@ -1728,13 +2031,13 @@ async def process_decision(
             step_number=step_number,
             event_type=current_event_type,
             narrative=current_narrative,
-            options_presented=options_presented_texts,
+            options_presented=options_presented,
             chosen_option=request.chosen_option,
-            money_before=state_before['money'],
-            fi_score_before=state_before['fi_score'],
-            energy_before=state_before['energy'],
-            motivation_before=state_before['motivation'],
-            social_before=state_before['social'],
+            money_before=state_before.money,
+            fi_score_before=state_before.fi_score,
+            energy_before=state_before.energy,
+            motivation_before=state_before.motivation,
+            social_before=state_before.social,
             money_after=game_state.money,
             fi_score_after=game_state.fi_score,
             energy_after=game_state.energy,
@@ -1770,43 +2073,18 @@ async def process_decision(
         db_session.add(transaction_log)
 
         # Update game state in database
-        with timer("9. DB: Commit and refresh"):
+        # One transaction for the GameState UPDATE and the history/log INSERTs.
+        # No refresh afterwards: there are no server-side defaults to reload
+        # and expire_on_commit=False keeps the in-memory values valid.
+        with timer("9. DB: Commit"):
             await db_session.commit()
-            await db_session.refresh(game_state)
+        remember_session_state(request.session_id, profile, game_state)
 
         # Build updated state response
-        updated_state = GameStateResponse(
-            session_id=request.session_id,
-            current_step=game_state.current_step,
-            current_age=game_state.current_age,
-            years_passed=game_state.years_passed,
-            months_passed=game_state.months_passed,
-            month_phase=game_state.month_phase,
-            money=game_state.money,
-            monthly_income=game_state.monthly_income,
-            monthly_expenses=game_state.monthly_expenses,
-            expense_housing=game_state.expense_housing,
-            expense_food=game_state.expense_food,
-            expense_transport=game_state.expense_transport,
-            expense_utilities=game_state.expense_utilities,
-            expense_subscriptions=game_state.expense_subscriptions,
-            expense_insurance=game_state.expense_insurance,
-            expense_other=game_state.expense_other,
-            active_subscriptions=game_state.active_subscriptions,
-            investments=game_state.investments,
-            passive_income=game_state.passive_income,
-            debts=game_state.debts,
-            fi_score=game_state.fi_score,
-            energy=game_state.energy,
-            motivation=game_state.motivation,
-            social_life=game_state.social_life,
-            financial_knowledge=game_state.financial_knowledge,
-            assets=game_state.assets,
-            game_status=game_state.game_status
-        )
+        updated_state = build_state_response(game_state, request.session_id)
 
-        print(
-            f"📤 RESPONSE - Investments being sent: {updated_state.investments}")
+        logger.debug("📤 RESPONSE - Investments being sent: %s",
+                     updated_state.investments)
 
         # Create timestamp for transaction
         month_name = get_current_month_name(game_state.months_passed)
@@ -1847,11 +2125,11 @@ async def process_decision(
 
         # Create monthly cash flow transaction (if applied this step)
         monthly_flow_transaction = None
-        if cash_flow_data.get("applied", False):
+        if cash_flow_applied:
             monthly_flow_transaction = TransactionSummary(
                 cash_change=cash_flow_data["cash_change"],
                 investment_change=0.0,
-                debt_change=cash_flow_data.get("debt_from_deficit", 0.0),
+                debt_change=cash_flow_data["debt_from_deficit"],
                 monthly_income_change=0.0,
                 monthly_expense_change=0.0,
                 passive_income_change=0.0,
@@ -1867,11 +2145,11 @@ async def process_decision(
 
         # Create monthly cash flow summary for response
         monthly_cash_flow_summary = MonthlyCashFlowSummary(
-            applied=cash_flow_data.get("applied", False),
-            income_received=cash_flow_data.get("income_received", 0.0),
-            expenses_paid=cash_flow_data.get("expenses_paid", 0.0),
-            net_change=cash_flow_data.get("cash_change", 0.0),
-            debt_from_deficit=cash_flow_data.get("debt_from_deficit", 0.0),
+            applied=cash_flow_applied,
+            income_received=cash_flow_data["income_received"] if cash_flow_applied else 0.0,
+            expenses_paid=cash_flow_data["expenses_paid"] if cash_flow_applied else 0.0,
+            net_change=cash_flow_data["cash_change"] if cash_flow_applied else 0.0,
+            debt_from_deficit=cash_flow_data["debt_from_deficit"] if cash_flow_applied else 0.0,
             month_name=get_current_month_name(game_state.months_passed),
             month_phase=game_state.month_phase,
             month_phase_name=get_month_phase_name(game_state.month_phase)
@@ -1879,23 +2157,10 @@ async def process_decision(
 
         # === TIMING: Print time before next question generation ===
         time_before_next = time.time() - start_total
-        print(
-            f"\n⏱️  Time to consequence (before next Q): {time_before_next:.3f}s\n")
-
-        # Start background task to generate next question
-        import asyncio
-        asyncio.create_task(
-            generate_and_cache_next_question(
-                game_state.id,
-                game_state,
-                profile,
-                db_session,
-                client
-            )
-        )
+        logger.debug("⏱️  Time to consequence (before next Q): %.3fs",
+                     time_before_next)
 
-        # Return consequence immediately (next question will be cached)
-        return DecisionResponse(
+        decision_response = DecisionResponse(
             consequence_narrative=consequence,
             updated_state=updated_state,
             next_narrative=None,  # Will be fetched separately
@@ -1908,12 +2173,32 @@ async def process_decision(
             is_generating_next=True
         )
 
+        if stream:
+            return StreamingResponse(
+                stream_decision_frames(
+                    decision_response,
+                    next_narrative_queue,
+                    next_narrative_task,
+                    next_event_type,
+                    game_state,
+                    profile,
+                    client
+                ),
+                media_type="application/x-ndjson",
+                # Stop proxies from buffering the frames until the stream ends
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+            )
+
+        # Return consequence immediately (next question is being cached)
+        return decision_response
+
     except HTTPException:
         raise
     except Exception as e:
+        if next_narrative_task is not None:
+            next_narrative_task.cancel()
         await db_session.rollback()
-        import traceback
-        traceback.print_exc()
+        logger.exception("Decision processing failed")
         raise HTTPException(
             status_code=500, detail=f"Error processing decision: {str(e)}")
 
@@ -1930,35 +2215,21 @@ async def get_next_question(
     Returns the cached narrative and options if available, otherwise generates them on-demand.
     """
     try:
-        import json
-
-        # Get profile and game state
-        result = await db_session.execute(
-            select(PlayerProfile).where(PlayerProfile.session_id == session_id)
-        )
-        profile = result.scalar_one_or_none()
-
-        if not profile:
-            raise HTTPException(status_code=404, detail="Session not found")
-
-        result = await db_session.execute(
-            select(GameState).where(GameState.profile_id == profile.id)
-        )
-        game_state = result.scalar_one_or_none()
-
-        if not game_state:
-            raise HTTPException(status_code=404, detail="Game state not found")
+        # Get the profile and its game state in one round-trip
+        profile, game_state = await load_session(db_session, session_id)
 
         # Check if we have a cached question
         if game_state.cached_next_narrative and game_state.cached_next_options:
-            print("✅ Returning cached next question")
+            logger.debug("✅ Returning cached next question")
             next_narrative = game_state.cached_next_narrative
-            next_options = json.loads(game_state.cached_next_options)
+            next_options = orjson.loads(game_state.cached_next_options)
 
-            # Clear the cache after retrieving
+            # Clear the cache after retrieving and remember what was served
             game_state.cached_next_narrative = None
             game_state.cached_next_options = None
+            game_state.presented_options = next_options
             await db_session.commit()
+            remember_session_state(session_id, profile, game_state)
 
             return {
                 "next_narrative": next_narrative,
@@ -1966,8 +2237,9 @@ async def get_next_question(
                 "was_cached": True
             }
 
-        # If not cached, generate on-demand
-        print("⚠️ Cache miss - generating next question on-demand")
+        # If not cached, generate on-demand - release the connection first
+        logger.debug("⚠️ Cache miss - generating next question on-demand")
+        await db_session.commit()
         client = get_ai_client()
 
         next_event_type = get_event_type(game_state, profile)
@@ -1975,29 +2247,24 @@ async def get_next_question(
         if next_event_type == "curveball":
             next_curveball = generate_curveball_event(game_state)
 
-        next_narrative = await generate_event_narrative(
+        next_narrative, next_options_data = await generate_event_bundle(
             event_type=next_event_type,
             state=game_state,
             profile=profile,
-            db_session=None,
             curveball=next_curveball,
             client=client
         )
 
-        next_options_data = generate_dynamic_options(
-            event_type=next_event_type,
-            narrative=next_narrative,
-            state=game_state,
-            profile=profile,
-            client=client
-        )
-
         # Add event context to each option
         for opt in next_options_data:
             opt['event_type'] = next_event_type
             opt['narrative'] = next_narrative
             opt['all_options'] = [o['text'] for o in next_options_data]
 
+        game_state.presented_options = next_options_data
+        await db_session.commit()
+        remember_session_state(session_id, profile, game_state)
+
         return {
             "next_narrative": next_narrative,
             "next_options": next_options_data,
@@ -2007,9 +2274,7 @@ async def get_next_question(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Failed to get next question: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Failed to get next question")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -12,6 +12,8 @@ This module defines the SQLModel models for:
 from typing import Optional, List, Dict
 from datetime import datetime
 from sqlmodel import Field, SQLModel, Relationship, JSON, Column
+from sqlalchemy import Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from enum import Enum
 
 
@@ -220,6 +222,10 @@ class GameState(SQLModel, table=True):
     cached_next_narrative: Optional[str] = None
     cached_next_options: Optional[str] = None  # JSON string of options list
 
+    # Options most recently served to the player (read back on /api/step)
+    presented_options: Optional[list] = Field(
+        default=None, sa_column=Column(JSON))
+
     # Timestamps
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
@@ -243,7 +249,10 @@ class DecisionHistory(SQLModel, table=True):
     narrative: str  # The story presented to the player
 
     # Decision made
-    options_presented: List[str] = Field(default=[], sa_column=Column(JSON))
+    # Option dicts (text, risk_level, category, ...); older rows hold plain texts.
+    # Stored as binary JSONB on PostgreSQL so analytics can query into it.
+    options_presented: List[Dict] = Field(
+        default=[], sa_column=Column(JSON().with_variant(JSONB(), "postgresql")))
     chosen_option: str
 
     # State before decision
@@ -272,6 +281,17 @@ class DecisionHistory(SQLModel, table=True):
     # Relationships
     player_profile: PlayerProfile = Relationship(back_populates="decisions")
 
+    # Per-player history in step order; on PostgreSQL the summary columns are
+    # carried in the index so the summary query never touches the table
+    __table_args__ = (
+        Index(
+            "ix_decision_history_profile_step",
+            "profile_id", text("step_number DESC"),
+            postgresql_include=["event_type", "chosen_option",
+                                "fi_score_before", "fi_score_after"]
+        ),
+    )
+
 
 # Transaction Log Model
 class TransactionLog(SQLModel, table=True):
@@ -314,6 +334,11 @@ class TransactionLog(SQLModel, table=True):
     # Timestamp
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+    # Per-player logs are read back in step order
+    __table_args__ = (
+        Index("ix_transaction_logs_profile_step", "profile_id", "step_number"),
+    )
+
 
 # Leaderboard Model
 class LeaderboardEntry(SQLModel, table=True):
@@ -357,7 +382,16 @@ class LeaderboardEntry(SQLModel, table=True):
     # Timestamp
     completed_at: datetime = Field(default_factory=datetime.utcnow)
 
-    # Index for leaderboard queries
+    # Index for leaderboard queries (ORDER BY final_fi_score DESC LIMIT n);
+    # on PostgreSQL it also covers the columns the endpoint returns
+    __table_args__ = (
+        Index(
+            "ix_leaderboard_final_fi_score", text("final_fi_score DESC"),
+            postgresql_include=["player_name", "balance_score", "age",
+                                "education_path", "completed_at", "is_test_mode"]
+        ),
+    )
+
     class Config:
         arbitrary_types_allowed = True
 
@@ -402,6 +436,13 @@ class ChatMessage(SQLModel, table=True):
     Stores individual chat messages in a conversation.
     """
     __tablename__ = "chat_messages"
+    # History pages walk a session's messages newest-first
+    __table_args__ = (
+        Index(
+            "ix_chat_messages_session_created",
+            "chat_session_id", text("created_at DESC"), text("id DESC")
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     # Link to chat session
@@ -694,15 +735,18 @@ class ChatHistoryResponse(SQLModel):
 # Authentication API Models
 class RegisterRequest(SQLModel):
     """Request model for account registration"""
-    username: str = Field(min_length=3, max_length=50)
-    password: str = Field(min_length=6, max_length=100)
+    username: str = Field(min_length=3, max_length=50,
+                          schema_extra={"pattern": r"^[a-zA-Z0-9_]+$"})
+    # bcrypt only uses the first 72 bytes of a password
+    password: str = Field(min_length=6, max_length=72)
     display_name: str = Field(min_length=1, max_length=100)
 
 
 class LoginRequest(SQLModel):
     """Request model for login"""
-    username: str
-    password: str
+    username: str = Field(max_length=50)
+    # Accounts registered before the 72-character limit may have up to 100
+    password: str = Field(max_length=100)
 
 
 class AuthResponse(SQLModel):
@@ -37,18 +37,20 @@ EDUCATION_PATHS = [
 async def create_test_accounts():
     """Create test accounts"""
     async with AsyncSession(async_engine) as session:
-        for account_data in TEST_ACCOUNTS:
-            # Check if account already exists
-            result = await session.execute(
-                select(Account).where(Account.username == account_data["username"])
+        # Check which accounts already exist in one query
+        result = await session.execute(
+            select(Account.username).where(
+                Account.username.in_([acc["username"] for acc in TEST_ACCOUNTS])
             )
-            existing = result.scalar_one_or_none()
-            
-            if existing:
+        )
+        existing = set(result.scalars().all())
+
+        for account_data in TEST_ACCOUNTS:
+            if account_data["username"] in existing:
                 print(f"Account {account_data['username']} already exists, skipping...")
                 continue
             
-            # Create account
+            # Create account - rows are inserted together at commit
             account = Account(
                 username=account_data["username"],
                 password_hash=hash_password("test123"),
@@ -57,7 +59,6 @@ async def create_test_accounts():
                 created_at=datetime.utcnow() - timedelta(days=random.randint(1, 30))
             )
             session.add(account)
-            await session.flush()
             
             print(f"✅ Created account: {account_data['username']}")
         
@@ -9,10 +9,17 @@ from google import genai
 import os
 from dotenv import load_dotenv
 import json
-from functools import lru_cache
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 
 load_dotenv()
 
+# The Chroma HTTP client and the embedding call are blocking; async callers
+# run them here so a retrieval never stalls the event loop
+RAG_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("RAG_WORKERS", "16")), thread_name_prefix="rag")
+
 
 class RAGService:
     """
@@ -241,6 +248,20 @@ class RAGService:
         
         return concepts
     
+    async def retrieve_financial_concepts_async(self, **kwargs) -> List[Dict]:
+        """
+        Non-blocking retrieve_financial_concepts for async code.
+
+        Args:
+            **kwargs: Arguments of retrieve_financial_concepts
+
+        Returns:
+            List of relevant concept chunks with metadata
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            RAG_EXECUTOR, partial(self.retrieve_financial_concepts, **kwargs))
+    
     # ==========================================
     # Player Decision History Index (FUTURE USE - NOT USED IN MVP)
     # ==========================================
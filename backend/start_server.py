@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """
 Quick start script for LifeSim backend development.
-Runs the FastAPI server with auto-reload.
+Runs the FastAPI server (with auto-reload unless SERVER_RELOAD=false).
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
@@ -25,15 +26,24 @@ def main():
     backend_dir = os.path.dirname(os.path.abspath(__file__))
     os.chdir(backend_dir)
 
+    # uvloop and httptools come with uvicorn[standard] (uvloop is not
+    # available on Windows, which keeps the default asyncio loop).
+    # A single worker: session snapshots and caches live in process memory.
+    has_uvloop = importlib.util.find_spec("uvloop") is not None
+    command = [
+        sys.executable, "-m", "uvicorn",
+        "main:app",
+        "--loop", "uvloop" if has_uvloop else "asyncio",
+        "--http", "httptools",
+        "--host", "0.0.0.0",
+        "--port", "8000"
+    ]
+    # Auto-reload is for development; the container start script turns it off
+    if os.getenv("SERVER_RELOAD", "true").lower() == "true":
+        command.append("--reload")
+
     try:
-        # Run uvicorn with auto-reload
-        subprocess.run([
-            sys.executable, "-m", "uvicorn",
-            "main:app",
-            "--reload",
-            "--host", "0.0.0.0",
-            "--port", "8000"
-        ])
+        subprocess.run(command)
     except KeyboardInterrupt:
         print("\n\n👋 Server stopped")
         sys.exit(0)
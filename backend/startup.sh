@@ -63,4 +63,4 @@ pip3 install mcp --break-system-packages
 echo ""
 echo "🎮 Starting LifeSim backend server..."
 echo "================================"
-exec python3 /app/start_server.py
+SERVER_RELOAD=false exec python3 /app/start_server.py
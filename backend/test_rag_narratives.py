@@ -113,7 +113,7 @@ async def test_rag_narratives():
         }
     ]
     
-    options = generate_option_texts(
+    options = await generate_option_texts(
         option_descriptions=option_descriptions,
         event_type="investment_decision",
         state=state,
@@ -9,7 +9,7 @@ This module contains pure functions for:
 """
 
 from models import GameState, PlayerProfile, RiskAttitude, EducationPath
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 import uuid
 
 
@@ -427,6 +427,49 @@ async def get_recent_decisions(
     return list(reversed(decisions))  # Return chronologically (oldest first)
 
 
+# Histories longer than this get an AI summary instead of raw decisions
+DECISION_SUMMARY_THRESHOLD = 10
+
+
+async def count_decisions_capped(
+    profile_id: int,
+    db_session,
+    cap: Optional[int] = DECISION_SUMMARY_THRESHOLD + 1
+) -> int:
+    """
+    Count a player's decisions, stopping once cap rows are found.
+
+    Reads at most cap index entries instead of counting the whole history,
+    which is enough to compare against DECISION_SUMMARY_THRESHOLD.
+
+    Args:
+        profile_id: Player profile ID
+        db_session: AsyncSession for database access
+        cap: Maximum count to report (None counts every decision)
+
+    Returns:
+        min(number of decisions, cap)
+    """
+    from sqlmodel import select, func
+    from models import DecisionHistory
+
+    if cap is None:
+        # Uncapped: let the database count instead of shipping every id
+        result = await db_session.execute(
+            select(func.count())
+            .select_from(DecisionHistory)
+            .where(DecisionHistory.profile_id == profile_id)
+        )
+        return result.scalar_one()
+
+    result = await db_session.execute(
+        select(DecisionHistory.id)
+        .where(DecisionHistory.profile_id == profile_id)
+        .limit(cap)
+    )
+    return len(result.all())
+
+
 def format_decisions_for_llm(decisions: list, include_summary: bool = False, summary_text: str = None) -> str:
     """
     Format decision history for LLM context in a structured way.
@@ -473,36 +516,150 @@ def format_decisions_for_llm(decisions: list, include_summary: bool = False, sum
     return "\n".join(lines)
 
 
+def decision_summary_query(profile_id: int):
+    """
+    Build the SELECT for create_decision_summary input.
+
+    Only the columns the summary reads are fetched, so the large narrative
+    and consequence texts are never loaded. The rows support the same
+    attribute access as DecisionHistory records.
+
+    Args:
+        profile_id: Player profile ID
+
+    Returns:
+        Select over the summary columns, ordered by step_number
+    """
+    from sqlmodel import select
+    from models import DecisionHistory
+
+    return (
+        select(
+            DecisionHistory.step_number,
+            DecisionHistory.event_type,
+            DecisionHistory.chosen_option,
+            DecisionHistory.fi_score_before,
+            DecisionHistory.fi_score_after
+        )
+        .where(DecisionHistory.profile_id == profile_id)
+        .order_by(DecisionHistory.step_number)
+    )
+
+
+def summarize_decision_stats(decisions: list) -> Dict:
+    """
+    Compute create_decision_summary statistics from loaded decisions.
+
+    Args:
+        decisions: DecisionHistory records or decision_summary_query rows,
+            ordered by step_number
+
+    Returns:
+        Dict in the same shape as load_decision_summary_stats
+    """
+    from collections import Counter
+
+    fi_changes = [d.fi_score_after - d.fi_score_before for d in decisions]
+    return {
+        "total_decisions": len(decisions),
+        "fi_start": decisions[0].fi_score_before if decisions else 0,
+        "avg_fi_change": sum(fi_changes) / len(fi_changes) if fi_changes else 0,
+        "event_counts": Counter(d.event_type for d in decisions),
+        "first_decisions": list(decisions[:10])
+    }
+
+
+async def load_decision_summary_stats(
+    profile_id: int,
+    db_session,
+    exclude_steps=()
+) -> Dict:
+    """
+    Aggregate a player's decisions for create_decision_summary in SQL.
+
+    The per-event-type counts and FI changes come from one GROUP BY query
+    and only the first 10 decisions (the ones the summary quotes) are
+    loaded, so long histories are never materialized row by row.
+
+    Args:
+        profile_id: Player profile ID
+        db_session: AsyncSession for database access
+        exclude_steps: Step numbers to leave out (e.g. the recent decisions
+            shown raw next to the summary)
+
+    Returns:
+        Dict with total_decisions, fi_start, avg_fi_change, event_counts
+        (Counter, in order of first appearance) and first_decisions
+    """
+    from collections import Counter
+    from sqlmodel import select, func
+    from models import DecisionHistory
+
+    conditions = [DecisionHistory.profile_id == profile_id]
+    if exclude_steps:
+        conditions.append(DecisionHistory.step_number.notin_(exclude_steps))
+
+    grouped = await db_session.execute(
+        select(
+            DecisionHistory.event_type,
+            func.count(),
+            func.sum(DecisionHistory.fi_score_after -
+                     DecisionHistory.fi_score_before)
+        )
+        .where(*conditions)
+        .group_by(DecisionHistory.event_type)
+        .order_by(func.min(DecisionHistory.step_number))
+    )
+    event_counts = Counter()
+    total_fi_change = 0.0
+    for event_type, count, fi_change in grouped.all():
+        event_counts[event_type] = count
+        total_fi_change += fi_change or 0
+    total_decisions = sum(event_counts.values())
+
+    first_result = await db_session.execute(
+        decision_summary_query(profile_id).where(*conditions[1:]).limit(10))
+    first_decisions = first_result.all()
+
+    return {
+        "total_decisions": total_decisions,
+        "fi_start": first_decisions[0].fi_score_before if first_decisions else 0,
+        "avg_fi_change": total_fi_change / total_decisions if total_decisions else 0,
+        "event_counts": event_counts,
+        "first_decisions": first_decisions
+    }
+
+
 async def create_decision_summary(
     decisions: list,
     current_age: int,
-    current_fi_score: float
+    current_fi_score: float,
+    stats: Optional[Dict] = None
 ) -> str:
     """
     Create an AI-generated summary of decisions when history is long (>10 decisions).
 
     Args:
-        decisions: List of DecisionHistory records to summarize
+        decisions: DecisionHistory records or decision_summary_query rows
         current_age: Player's current age
         current_fi_score: Player's current FI score
+        stats: Precomputed load_decision_summary_stats result (optional;
+            computed from decisions when omitted)
 
     Returns:
         AI-generated summary text (or fallback summary if AI unavailable)
     """
-    if len(decisions) <= 5:
+    if stats is None:
+        stats = summarize_decision_stats(decisions)
+
+    if stats["total_decisions"] <= 5:
         return ""  # No summary needed for short histories
 
     # Calculate key metrics
-    fi_start = decisions[0].fi_score_before if decisions else 0
+    fi_start = stats["fi_start"]
     fi_progress = current_fi_score - fi_start
-
-    # Count major event types
-    from collections import Counter
-    event_counts = Counter(d.event_type for d in decisions)
-
-    # Calculate average decision quality (FI score changes)
-    fi_changes = [d.fi_score_after - d.fi_score_before for d in decisions]
-    avg_change = sum(fi_changes) / len(fi_changes) if fi_changes else 0
+    event_counts = stats["event_counts"]
+    avg_change = stats["avg_fi_change"]
 
     # Try AI summarization
     try:
@@ -514,7 +671,7 @@ async def create_decision_summary(
         # Build context for AI
         decision_snippets = "\n".join([
             f"- Step {d.step_number} ({d.event_type}): {d.chosen_option[:80]} → FI {d.fi_score_after:.1f}%"
-            for d in decisions[:10]  # Summarize first 10
+            for d in stats["first_decisions"]  # Summarize first 10
         ])
 
         prompt = f"""Summarize this player's financial journey in 2-3 sentences:
@@ -527,7 +684,7 @@ Key decisions:
 
 Write a concise narrative summary focusing on their financial trajectory and decision patterns."""
 
-        response = client.models.generate_content(
+        response = await client.aio.models.generate_content(
             model='gemini-2.0-flash-exp',
             contents=prompt
         )
@@ -545,7 +702,7 @@ Write a concise narrative summary focusing on their financial trajectory and dec
 
         return (
             f"Journey started at FI Score {fi_start:.1f}%, now at {current_fi_score:.1f}% ({trend}). "
-            f"Encountered {len(decisions)} decisions including {top_events}. "
+            f"Encountered {stats['total_decisions']} decisions including {top_events}. "
             f"Average decision impact: {avg_change:+.1f}% per choice."
         )
 
@@ -574,41 +731,28 @@ async def get_decision_context_for_llm(
     Returns:
         Formatted context string for LLM prompt
     """
-    from models import DecisionHistory
-    from sqlmodel import select, func
-
-    # Count total decisions
-    count_result = await db_session.execute(
-        select(func.count(DecisionHistory.id))
-        .where(DecisionHistory.profile_id == profile_id)
-    )
-    total_decisions = count_result.scalar()
+    # Count decisions only as far as the summary threshold
+    total_decisions = await count_decisions_capped(profile_id, db_session)
 
     if total_decisions == 0:
         return "This is the start of the player's journey."
 
     # Short history: Just show last 5
-    if total_decisions <= 10:
+    if total_decisions <= DECISION_SUMMARY_THRESHOLD:
         decisions = await get_recent_decisions(profile_id, db_session, limit=5)
         return format_decisions_for_llm(decisions, include_summary=False)
 
     # Long history: Summary + recent decisions
     else:
-        # Get all decisions for summary
-        all_result = await db_session.execute(
-            select(DecisionHistory)
-            .where(DecisionHistory.profile_id == profile_id)
-            .order_by(DecisionHistory.step_number)
-        )
-        all_decisions = all_result.scalars().all()
-
         # Get recent decisions
         recent_decisions = await get_recent_decisions(profile_id, db_session, limit=max_recent)
 
-        # Generate summary of earlier decisions
-        earlier_decisions = [
-            d for d in all_decisions if d not in recent_decisions]
-        summary = await create_decision_summary(earlier_decisions, current_age, current_fi_score)
+        # Generate summary of earlier decisions from SQL aggregates
+        stats = await load_decision_summary_stats(
+            profile_id, db_session,
+            exclude_steps=[d.step_number for d in recent_decisions])
+        summary = await create_decision_summary(
+            stats["first_decisions"], current_age, current_fi_score, stats=stats)
 
         return format_decisions_for_llm(
             recent_decisions,